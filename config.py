@@ -31,6 +31,51 @@ def get_config_value(env_key, yaml_key, default_value, config_dict=None, value_t
     # Use default
     return value_type(default_value)
 
+def parse_list(value):
+    """
+    Parse a list value from YAML (native list) or from an environment
+    variable (comma separated string).
+    """
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+def parse_mapping(value):
+    """
+    Parse a mapping of name -> integer from YAML (native mapping) or from an
+    environment variable (comma separated name=value pairs).
+    """
+    if isinstance(value, dict):
+        return {str(key): int(item) for key, item in value.items()}
+    mapping = {}
+    for pair in parse_list(value):
+        key, _, item = pair.partition("=")
+        mapping[key.strip()] = int(item)
+    return mapping
+
+def parse_account_sets(value):
+    """
+    Parse named account sets from YAML (mapping of name -> list) or from an
+    environment variable (comma separated name=ACCOUNT ACCOUNT pairs).
+    """
+    if isinstance(value, dict):
+        return {str(name): parse_list(accounts) for name, accounts in value.items()}
+    account_sets = {}
+    for pair in parse_list(value):
+        name, _, accounts = pair.partition("=")
+        account_sets[name.strip()] = accounts.split()
+    return account_sets
+
+def parse_bool(value):
+    """Parse a boolean from YAML (native bool) or an environment variable"""
+    if isinstance(value, bool):
+        return value
+    if str(value).strip().lower() in ("1", "true", "yes", "on"):
+        return True
+    if str(value).strip().lower() in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean: {value}")
+
 # Try to load config.yml if it exists
 config = {}
 try:
@@ -64,6 +109,15 @@ SOLANA_WS_ENDPOINT = get_config_value(
     config
 )
 
+# Websocket of the reference network, by default the RPC endpoint with
+# http(s) replaced by ws(s)
+NETWORK_WS_ENDPOINT = get_config_value(
+    "NETWORK_WS_ENDPOINT",
+    "network_ws_endpoint",
+    "",
+    config
+) or NETWORK_RPC_ENDPOINT.replace("http", "ws", 1)
+
 # Numeric configurations
 THREAD_POOL_SIZE = get_config_value(
     "THREAD_POOL_SIZE", 
@@ -104,13 +158,303 @@ LOG_LEVEL = get_config_value(
     config
 )
 
+# Vote account monitoring
+VOTE_ACCOUNTS_INTERVAL = get_config_value(
+    "VOTE_ACCOUNTS_INTERVAL",
+    "vote_accounts_interval",
+    60,
+    config,
+    int
+)
+
+VOTE_WATCH_LIST = get_config_value(
+    "VOTE_WATCH_LIST",
+    "vote_watch_list",
+    "",
+    config,
+    parse_list
+)
+
+# Label cardinality limits
+LABEL_BUDGET_DEFAULT = get_config_value(
+    "LABEL_BUDGET_DEFAULT",
+    "label_budget_default",
+    50,
+    config,
+    int
+)
+
+LABEL_BUDGETS = get_config_value(
+    "LABEL_BUDGETS",
+    "label_budgets",
+    "",
+    config,
+    parse_mapping
+)
+
+# Host-side disk monitoring (only when running next to the validator)
+LEDGER_PATH = get_config_value(
+    "LEDGER_PATH",
+    "ledger_path",
+    "",
+    config
+)
+
+ACCOUNTS_PATH = get_config_value(
+    "ACCOUNTS_PATH",
+    "accounts_path",
+    "",
+    config
+)
+
+DISK_FULL_SCAN_INTERVAL = get_config_value(
+    "DISK_FULL_SCAN_INTERVAL",
+    "disk_full_scan_interval",
+    3600,
+    config,
+    int
+)
+
+# Commitment latency tracking
+COMMITMENT_POLL_INTERVAL = get_config_value(
+    "COMMITMENT_POLL_INTERVAL",
+    "commitment_poll_interval",
+    1.0,
+    config,
+    float
+)
+
+COMMITMENT_TRACKED_SLOTS = get_config_value(
+    "COMMITMENT_TRACKED_SLOTS",
+    "commitment_tracked_slots",
+    512,
+    config,
+    int
+)
+
+# RPC record and replay (live, record or replay)
+RPC_MODE = get_config_value(
+    "RPC_MODE",
+    "rpc_mode",
+    "live",
+    config
+)
+
+RPC_CAPTURE_FILE = get_config_value(
+    "RPC_CAPTURE_FILE",
+    "rpc_capture_file",
+    "capture/rpc.capture.gz",
+    config
+)
+
+RPC_REPLAY_SPEED = get_config_value(
+    "RPC_REPLAY_SPEED",
+    "rpc_replay_speed",
+    1.0,
+    config,
+    float
+)
+
+# RPC response cache; entries live for one collection cycle, or shorter
+# when a TTL in seconds is set (0 disables the TTL)
+RPC_CACHE_TTL = get_config_value(
+    "RPC_CACHE_TTL",
+    "rpc_cache_ttl",
+    0,
+    config,
+    float
+)
+
+# Prioritization fee monitoring
+FEE_ACCOUNT_SETS = get_config_value(
+    "FEE_ACCOUNT_SETS",
+    "fee_account_sets",
+    "",
+    config,
+    parse_account_sets
+)
+
+FEE_WINDOW_SLOTS = get_config_value(
+    "FEE_WINDOW_SLOTS",
+    "fee_window_slots",
+    900,
+    config,
+    int
+)
+
+# Signature ingestion for a watch-list of addresses
+TX_WATCH_ADDRESSES = get_config_value(
+    "TX_WATCH_ADDRESSES",
+    "tx_watch_addresses",
+    "11111111111111111111111111111111",
+    config,
+    parse_list
+)
+
+TX_CURSOR_FILE = get_config_value(
+    "TX_CURSOR_FILE",
+    "tx_cursor_file",
+    "state/tx_cursors.json",
+    config
+)
+
+TX_WATCH_CONCURRENCY = get_config_value(
+    "TX_WATCH_CONCURRENCY",
+    "tx_watch_concurrency",
+    4,
+    config,
+    int
+)
+
+TX_MAX_PAGES = get_config_value(
+    "TX_MAX_PAGES",
+    "tx_max_pages",
+    10,
+    config,
+    int
+)
+
+# Signature backlog (in slots) beyond which the oldest signatures are
+# skipped uncounted, 0 to never skip
+TX_MAX_BACKLOG_SLOTS = get_config_value(
+    "TX_MAX_BACKLOG_SLOTS",
+    "tx_max_backlog_slots",
+    432000,
+    config,
+    int
+)
+
+# Readiness endpoint for load balancers
+READY_PORT = get_config_value(
+    "READY_PORT",
+    "ready_port",
+    6661,
+    config,
+    int
+)
+
+READY_NODE_NAME = get_config_value(
+    "READY_NODE_NAME",
+    "ready_node_name",
+    "local",
+    config
+)
+
+READY_MAX_SLOT_LAG = get_config_value(
+    "READY_MAX_SLOT_LAG",
+    "ready_max_slot_lag",
+    10,
+    config,
+    float
+)
+
+READY_MAX_BLOCK_TIME_LAG = get_config_value(
+    "READY_MAX_BLOCK_TIME_LAG",
+    "ready_max_block_time_lag",
+    60,
+    config,
+    float
+)
+
+READY_REQUIRE_WEBSOCKET = get_config_value(
+    "READY_REQUIRE_WEBSOCKET",
+    "ready_require_websocket",
+    True,
+    config,
+    parse_bool
+)
+
+# Consecutive passing (rise) or failing (fall) evaluations needed to flip
+READY_RISE = get_config_value(
+    "READY_RISE",
+    "ready_rise",
+    2,
+    config,
+    int
+)
+
+READY_FALL = get_config_value(
+    "READY_FALL",
+    "ready_fall",
+    2,
+    config,
+    int
+)
+
+# Gossip cluster view
+GOSSIP_INTERVAL = get_config_value(
+    "GOSSIP_INTERVAL",
+    "gossip_interval",
+    300,
+    config,
+    int
+)
+
+# Account watch-list
+ACCOUNT_WATCH_LIST = get_config_value(
+    "ACCOUNT_WATCH_LIST",
+    "account_watch_list",
+    "",
+    config,
+    parse_list
+)
+
+ACCOUNT_WATCH_CONCURRENCY = get_config_value(
+    "ACCOUNT_WATCH_CONCURRENCY",
+    "account_watch_concurrency",
+    4,
+    config,
+    int
+)
+
+# Leading bytes of account data hashed to detect data changes (0 = none)
+ACCOUNT_DATA_SLICE = get_config_value(
+    "ACCOUNT_DATA_SLICE",
+    "account_data_slice",
+    0,
+    config,
+    int
+)
+
 # Log the final configuration
 logger.info("Configuration values:")
 logger.info(f"NETWORK_RPC_ENDPOINT: {NETWORK_RPC_ENDPOINT}")
 logger.info(f"SOLANA_RPC_ENDPOINT: {SOLANA_RPC_ENDPOINT}")
 logger.info(f"SOLANA_WS_ENDPOINT: {SOLANA_WS_ENDPOINT}")
+logger.info(f"NETWORK_WS_ENDPOINT: {NETWORK_WS_ENDPOINT}")
 logger.info(f"THREAD_POOL_SIZE: {THREAD_POOL_SIZE}")
 logger.info(f"SLEEP_TIME: {SLEEP_TIME}")
 logger.info(f"PORT: {PORT}")
 logger.info(f"LOG_LEVEL: {LOG_LEVEL}")
 logger.info(f"RETRY: {RETRY}")
+logger.info(f"VOTE_ACCOUNTS_INTERVAL: {VOTE_ACCOUNTS_INTERVAL}")
+logger.info(f"VOTE_WATCH_LIST: {VOTE_WATCH_LIST}")
+logger.info(f"LABEL_BUDGET_DEFAULT: {LABEL_BUDGET_DEFAULT}")
+logger.info(f"LABEL_BUDGETS: {LABEL_BUDGETS}")
+logger.info(f"LEDGER_PATH: {LEDGER_PATH}")
+logger.info(f"ACCOUNTS_PATH: {ACCOUNTS_PATH}")
+logger.info(f"DISK_FULL_SCAN_INTERVAL: {DISK_FULL_SCAN_INTERVAL}")
+logger.info(f"COMMITMENT_POLL_INTERVAL: {COMMITMENT_POLL_INTERVAL}")
+logger.info(f"COMMITMENT_TRACKED_SLOTS: {COMMITMENT_TRACKED_SLOTS}")
+logger.info(f"RPC_MODE: {RPC_MODE}")
+logger.info(f"RPC_CAPTURE_FILE: {RPC_CAPTURE_FILE}")
+logger.info(f"RPC_REPLAY_SPEED: {RPC_REPLAY_SPEED}")
+logger.info(f"RPC_CACHE_TTL: {RPC_CACHE_TTL}")
+logger.info(f"FEE_ACCOUNT_SETS: {FEE_ACCOUNT_SETS}")
+logger.info(f"FEE_WINDOW_SLOTS: {FEE_WINDOW_SLOTS}")
+logger.info(f"TX_WATCH_ADDRESSES: {TX_WATCH_ADDRESSES}")
+logger.info(f"TX_CURSOR_FILE: {TX_CURSOR_FILE}")
+logger.info(f"TX_WATCH_CONCURRENCY: {TX_WATCH_CONCURRENCY}")
+logger.info(f"TX_MAX_PAGES: {TX_MAX_PAGES}")
+logger.info(f"TX_MAX_BACKLOG_SLOTS: {TX_MAX_BACKLOG_SLOTS}")
+logger.info(f"READY_PORT: {READY_PORT}")
+logger.info(f"READY_NODE_NAME: {READY_NODE_NAME}")
+logger.info(f"READY_MAX_SLOT_LAG: {READY_MAX_SLOT_LAG}")
+logger.info(f"READY_MAX_BLOCK_TIME_LAG: {READY_MAX_BLOCK_TIME_LAG}")
+logger.info(f"READY_REQUIRE_WEBSOCKET: {READY_REQUIRE_WEBSOCKET}")
+logger.info(f"READY_RISE: {READY_RISE}")
+logger.info(f"READY_FALL: {READY_FALL}")
+logger.info(f"GOSSIP_INTERVAL: {GOSSIP_INTERVAL}")
+logger.info(f"ACCOUNT_WATCH_LIST: {len(ACCOUNT_WATCH_LIST)} accounts")
+logger.info(f"ACCOUNT_WATCH_CONCURRENCY: {ACCOUNT_WATCH_CONCURRENCY}")
+logger.info(f"ACCOUNT_DATA_SLICE: {ACCOUNT_DATA_SLICE}")
@@ -1,5 +1,6 @@
 import asyncio
 from loguru import logger
+from config import SLEEP_TIME
 from modules.node_health import get_health
 from modules.slot_monitor import get_slot_info, get_block_heights
 from modules.tx_monitor import get_transaction_stats, get_transaction_types, get_confirmed_transactions_total
@@ -7,29 +8,81 @@ from modules.version import get_version
 from modules.websocket_monitor import check_websocket_health
 from modules.epoch_monitor import get_epoch_info
 from modules.block_time import get_block_time
+from modules.vote_monitor import get_vote_accounts
+from modules.disk_monitor import get_disk_usage
+from modules.commitment_monitor import get_commitment_latency
+from modules.fee_monitor import get_prioritization_fees
+from modules.gossip_monitor import get_cluster_nodes
+from modules.account_monitor import get_watched_accounts
+from utils.rpc import reset_rpc_cache
+from utils.cardinality import cardinality_guard
+from utils.readiness import evaluate_readiness
+
+
+# Collector functions by task name
+COLLECTORS = {
+    "block_time": get_block_time,
+    "health": get_health,
+    "slot_info": get_slot_info,
+    "block_heights": get_block_heights,
+    "tx_stats": get_transaction_stats,
+    "tx_types": get_transaction_types,
+    "version": get_version,
+    "websocket": check_websocket_health,
+    "epoch_info": get_epoch_info,
+    "confirmed_tx_total": get_confirmed_transactions_total,
+    "vote_accounts": get_vote_accounts,
+    "disk_usage": get_disk_usage,
+    "commitment_latency": get_commitment_latency,
+    "prioritization_fees": get_prioritization_fees,
+    "cluster_nodes": get_cluster_nodes,
+    "watched_accounts": get_watched_accounts
+}
+
+# Tasks recording the signals readiness is evaluated from
+READINESS_TASKS = ("health", "slot_info", "block_time", "websocket")
+
+# Tasks still running from an earlier cycle, by name
+_running = {}
+
+
+def _log_result(task_name, task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Error in {task_name}: {task.exception()}")
 
 
 async def run_async_tasks():
-    """Run all async monitoring tasks"""
-    tasks = {
-        "block_time": get_block_time(),
-        "health": get_health(),
-        "slot_info": get_slot_info(),
-        "block_heights": get_block_heights(),
-        "tx_stats": get_transaction_stats(),
-        "tx_types": get_transaction_types(),
-        "version": get_version(),
-        "websocket": check_websocket_health(),
-        "epoch_info": get_epoch_info(),
-        "confirmed_tx_total": get_confirmed_transactions_total()
-    }
+    """
+    Run all async monitoring tasks.
+
+    Readiness is evaluated as soon as its inputs are in. A cycle waits at
+    most SLEEP_TIME for the other tasks; slower ones keep running in the
+    background, publish when they finish, and are skipped by later cycles
+    until then.
+    """
+    tasks = {}
+    for task_name, collector in COLLECTORS.items():
+        running = _running.get(task_name)
+        if running is not None and not running.done():
+            logger.warning(f"Skipping {task_name}, still running from an earlier cycle")
+            continue
+        task = _running[task_name] = asyncio.ensure_future(collector())
+        task.add_done_callback(lambda task, task_name=task_name: _log_result(task_name, task))
+        tasks[task_name] = task
 
     try:
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
-        
-        for task_name, result in zip(tasks.keys(), results):
-            if isinstance(result, Exception):
-                logger.error(f"Error in {task_name}: {result}")
+        deadline = asyncio.get_event_loop().time() + SLEEP_TIME
+
+        readiness_inputs = [tasks[task_name] for task_name in READINESS_TASKS if task_name in tasks]
+        if readiness_inputs:
+            await asyncio.wait(readiness_inputs, timeout=SLEEP_TIME)
+        evaluate_readiness()
+
+        remaining = max(0, deadline - asyncio.get_event_loop().time())
+        _, pending = await asyncio.wait(tasks.values(), timeout=remaining)
+        if pending:
+            slow = [task_name for task_name, task in tasks.items() if task in pending]
+            logger.warning(f"Still running after {SLEEP_TIME}s, continuing in the background: {', '.join(slow)}")
     except Exception as e:
         logger.error(f"Error in collector: {e}")
 
@@ -39,7 +92,10 @@ async def collect():
     logger.info("Starting metrics collection")
     start_time = asyncio.get_event_loop().time()
 
+    # Identical RPC calls are shared by all modules within a cycle
+    reset_rpc_cache()
     await run_async_tasks()
+    cardinality_guard.end_cycle()
 
     end_time = asyncio.get_event_loop().time()
     logger.info(f"Metrics collection completed in {end_time - start_time:.2f} seconds")
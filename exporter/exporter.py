@@ -3,8 +3,12 @@ import signal
 from prometheus_client import start_http_server
 import time
 from loguru import logger
-from config import SLEEP_TIME, PORT, LOG_LEVEL
+from config import SLEEP_TIME, PORT, LOG_LEVEL, RPC_MODE
 from exporter.collector import collect
+from exporter.readiness import start_readiness_server
+from modules.commitment_monitor import run_commitment_tracker
+from modules.disk_monitor import run_disk_scanner
+from utils.rpc import scaled_interval, collection_sleep, replay_finished
 
 
 async def graceful_shutdown(loop, sig=None):
@@ -31,6 +35,15 @@ async def run_exporter():
     """Main function to run the Prometheus exporter"""
     logger.info(f"Starting Prometheus metrics server on localhost:{PORT}/metrics")
     start_http_server(PORT)
+    await start_readiness_server()
+
+    # Commitment propagation is tracked continuously, not once per cycle.
+    # Its timings are only meaningful against live endpoints.
+    if RPC_MODE != "replay":
+        asyncio.create_task(run_commitment_tracker())
+
+    # Directory walks can outlast a collection cycle, results are published per cycle
+    asyncio.create_task(run_disk_scanner())
 
     while True:
         start_time = time.time()
@@ -41,8 +54,12 @@ async def run_exporter():
         except Exception as e:
             logger.error(f"Error during metrics collection: {e}")
 
-        logger.info(f"Sleeping for {SLEEP_TIME} seconds")
-        await asyncio.sleep(SLEEP_TIME)
+        if replay_finished():
+            logger.info("RPC capture fully replayed, stopping collection")
+            break
+
+        logger.info(f"Sleeping for {scaled_interval(SLEEP_TIME)} seconds")
+        await collection_sleep(SLEEP_TIME)
 
 
 def main():
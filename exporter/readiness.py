@@ -0,0 +1,24 @@
+from aiohttp import web
+from loguru import logger
+from config import READY_PORT
+from utils.readiness import readiness_response
+
+
+async def handle_ready(request):
+    """Serve readiness from the last collected state, never calling the node"""
+    status, body = readiness_response(request.match_info.get("node"))
+    return web.Response(status=status, body=body, content_type="application/json")
+
+
+async def start_readiness_server():
+    """Start the /ready endpoint for load balancer health checks"""
+    app = web.Application()
+    app.router.add_get("/ready", handle_ready)
+    app.router.add_get("/ready/{node}", handle_ready)
+
+    # Access logging would dominate the cost of thousands of probes per second
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, port=READY_PORT).start()
+    logger.info(f"Starting readiness server on localhost:{READY_PORT}/ready")
+    return runner
@@ -5,6 +5,7 @@ __all__ = [
     'solana_node_health',
     'solana_node_slots_behind',
     'solana_node_version',
+    'solana_node_ready',
 
     # Block and slot metrics
     'solana_block_height',
@@ -19,6 +20,12 @@ __all__ = [
     'solana_max_retransmit_slot',
     'solana_net_max_shred_insert_slot',
     'solana_net_max_retransmit_slot',
+    'solana_max_shred_insert_slot_diff',
+    'solana_max_retransmit_slot_diff',
+
+    # Paired probe metrics
+    'solana_paired_probe_skew',
+    'solana_slot_rate',
 
     # RPC performance metrics
     'solana_rpc_highest_processed_slot',
@@ -38,6 +45,9 @@ __all__ = [
     'solana_rpc_tx_by_type',
     'solana_rpc_tx_latency',
     'solana_confirmed_transactions_total',
+    'solana_rpc_tx_signatures',
+    'solana_rpc_tx_signature_backlog',
+    'solana_rpc_tx_signature_skipped',
 
     # Epoch metrics
     'solana_network_epoch',
@@ -46,5 +56,55 @@ __all__ = [
     
     # Block time metrics
     'solana_block_time',
-    'solana_block_time_diff'
+    'solana_block_time_diff',
+
+    # Vote account metrics
+    'solana_validator_activated_stake',
+    'solana_validator_commission',
+    'solana_validator_delinquent',
+    'solana_validator_last_vote',
+    'solana_validator_root_slot',
+    'solana_validator_vote_lag',
+    'solana_validator_root_lag',
+    'solana_validator_epoch_credits',
+    'solana_cluster_validators',
+    'solana_cluster_delinquent_stake_fraction',
+    'solana_cluster_epoch_credits',
+
+    # Label cardinality metrics
+    'solana_exporter_label_sets',
+    'solana_exporter_dropped_label_sets',
+    'solana_exporter_overflow_label_sets',
+
+    # Disk metrics
+    'solana_disk_directory_bytes',
+    'solana_disk_directory_files',
+    'solana_disk_rescanned_directories',
+    'solana_disk_filesystem_size_bytes',
+    'solana_disk_filesystem_used_bytes',
+    'solana_rocksdb_sst_files',
+    'solana_rocksdb_sst_bytes',
+
+    # Commitment latency metrics
+    'solana_commitment_slot',
+    'solana_commitment_delay',
+    'solana_commitment_delay_diff',
+
+    # Prioritization fee metrics
+    'solana_prioritization_fee',
+    'solana_prioritization_fee_nonzero_ratio',
+    'solana_prioritization_fee_slots',
+
+    # Gossip metrics
+    'solana_cluster_nodes',
+    'solana_cluster_rpc_nodes',
+    'solana_cluster_node_versions',
+    'solana_node_in_gossip',
+    'solana_gossip_events',
+
+    # Account watch-list metrics
+    'solana_account_balance',
+    'solana_account_exists',
+    'solana_account_last_change_slot',
+    'solana_account_changes'
 ]
\ No newline at end of file
@@ -1,9 +1,31 @@
-from prometheus_client import Gauge
+from prometheus_client import Gauge, Counter, Histogram
+
+
+def summable(metric):
+    """
+    Mark a labelled gauge whose values add up. Label sets beyond its label
+    budget are summed into an 'other' series instead of being dropped.
+    """
+    metric._summable = True
+    return metric
+
+
+def retained(metric):
+    """
+    Mark a labelled gauge whose collector writes label sets only when they
+    change or on a slower cadence, and removes label sets that go away
+    itself. Its label sets are kept and ranked while they are not written,
+    instead of expiring.
+    """
+    metric._retained = True
+    return metric
+
 
 # Node health metrics
 solana_node_health = Gauge('solana_node_health', 'Health status of the Solana RPC node', ['status', 'cause'])
 solana_node_slots_behind = Gauge('solana_node_slots_behind', 'Number of slots the Solana RPC node is behind')
 solana_node_version = Gauge('solana_node_version', 'Node version of solana RPC', ['version'])
+solana_node_ready = Gauge('solana_node_ready', 'Readiness reported to load balancers (1=ready, 0=not ready)', ['node'])
 
 # Block and slot metrics
 solana_block_height = Gauge('solana_block_height', 'Current Block Height of your RPC node')
@@ -23,11 +45,17 @@ solana_max_shred_insert_slot = Gauge('solana_max_shred_insert_slot', 'Max slot s
 solana_max_retransmit_slot = Gauge('solana_max_retransmit_slot', 'Max slot seen from retransmit stage')
 solana_net_max_shred_insert_slot = Gauge('solana_net_max_shred_insert_slot', 'Max NETWORK slot seen from after shred insert')
 solana_net_max_retransmit_slot = Gauge('solana_net_max_retransmit_slot', 'Max NETWORK slot seen from retransmit stage')
+solana_max_shred_insert_slot_diff = Gauge('solana_max_shred_insert_slot_diff', 'Max shred insert slot difference between your RPC and network')
+solana_max_retransmit_slot_diff = Gauge('solana_max_retransmit_slot_diff', 'Max retransmit slot difference between your RPC and network')
+
+# Paired probe metrics
+solana_paired_probe_skew = Gauge('solana_paired_probe_skew_seconds', 'Time between the local and network response midpoints of a paired probe', ['method'])
+solana_slot_rate = Gauge('solana_slot_rate', 'Observed network progress per second used to correct lag metrics', ['series'])
 
 # RPC performance metrics
 solana_rpc_highest_processed_slot = Gauge('solana_rpc_highest_processed_slot', 'Highest slot processed by the RPC node')
-solana_rpc_requests = Gauge('solana_rpc_requests', 'Total RPC requests', ['method'])
-solana_rpc_errors = Gauge('solana_rpc_errors', 'Total RPC errors', ['method'])
+solana_rpc_requests = summable(Gauge('solana_rpc_requests', 'Total RPC requests', ['method']))
+solana_rpc_errors = summable(Gauge('solana_rpc_errors', 'Total RPC errors', ['method']))
 solana_rpc_latency = Gauge('solana_rpc_latency', 'RPC request latency in seconds', ['method'])
 
 # WebSocket metrics
@@ -39,11 +67,69 @@ solana_tx_count = Gauge('solana_tx_count', 'Total transaction count')
 solana_tx_success_rate = Gauge('solana_tx_success_rate', 'Transaction success rate')
 solana_tx_error_rate = Gauge('solana_tx_error_rate', 'Transaction error rate')
 solana_rpc_processed_tx_count = Gauge('solana_rpc_processed_tx_count', 'Number of transactions processed')
-solana_rpc_tx_by_type = Gauge('solana_rpc_tx_by_type', 'Transaction count by type', ['tx_type'])
+solana_rpc_tx_by_type = summable(Gauge('solana_rpc_tx_by_type', 'Transaction count by type', ['tx_type']))
 solana_rpc_tx_latency = Gauge('solana_rpc_tx_latency', 'Transactions per second', ['type'])
 solana_confirmed_transactions_total = Gauge('solana_confirmed_transactions_total', 'Total number of transactions processed since genesis (max confirmation)')
+solana_rpc_tx_signatures = Counter('solana_rpc_tx_signatures', 'Signatures ingested for a watched address by type', ['address', 'tx_type'])
+solana_rpc_tx_signature_backlog = Gauge('solana_rpc_tx_signature_backlog_slots', 'Slots of signatures of a watched address not counted yet because the page limit was hit', ['address'])
+solana_rpc_tx_signature_skipped = Counter('solana_rpc_tx_signature_skipped_slots', 'Slots of signatures of a watched address skipped uncounted because the backlog exceeded its maximum', ['address'])
 
 # Epoch metrics
 solana_network_epoch = Gauge('solana_network_epoch', 'Current epoch of network')
 solana_slot_in_epoch = Gauge('solana_slot_in_epoch', 'Current slot in epoch')
 solana_slot_index = Gauge('solana_slot_index', 'Current slot index')
+
+# Vote account metrics
+solana_validator_activated_stake = retained(summable(Gauge('solana_validator_activated_stake', 'Activated stake of a watched vote account in lamports', ['vote_pubkey'])))
+solana_validator_commission = retained(Gauge('solana_validator_commission', 'Commission of a watched vote account in percent', ['vote_pubkey']))
+solana_validator_delinquent = retained(summable(Gauge('solana_validator_delinquent', 'Delinquency of a watched vote account (1=delinquent, 0=current)', ['vote_pubkey'])))
+solana_validator_last_vote = retained(Gauge('solana_validator_last_vote', 'Most recent slot voted on by a watched vote account', ['vote_pubkey']))
+solana_validator_root_slot = retained(Gauge('solana_validator_root_slot', 'Current root slot of a watched vote account', ['vote_pubkey']))
+solana_validator_vote_lag = retained(Gauge('solana_validator_vote_lag', 'Slots between the highest cluster vote and the last vote of a watched vote account', ['vote_pubkey']))
+solana_validator_root_lag = retained(Gauge('solana_validator_root_lag', 'Slots between the highest cluster root and the root slot of a watched vote account', ['vote_pubkey']))
+solana_validator_epoch_credits = retained(summable(Gauge('solana_validator_epoch_credits', 'Vote credits earned in the current epoch by a watched vote account', ['vote_pubkey'])))
+solana_cluster_validators = retained(summable(Gauge('solana_cluster_validators', 'Number of vote accounts in the cluster', ['state'])))
+solana_cluster_delinquent_stake_fraction = Gauge('solana_cluster_delinquent_stake_fraction', 'Fraction of activated stake held by delinquent vote accounts')
+solana_cluster_epoch_credits = retained(Gauge('solana_cluster_epoch_credits', 'Distribution of vote credits earned in the current epoch across vote accounts', ['quantile']))
+
+# Label cardinality metrics
+solana_exporter_label_sets = Gauge('solana_exporter_label_sets', 'Label sets with their own series per metric', ['metric'])
+solana_exporter_dropped_label_sets = Counter('solana_exporter_dropped_label_sets', 'Updates folded into the other series or dropped because the label budget was exhausted', ['metric'])
+solana_exporter_overflow_label_sets = Gauge('solana_exporter_overflow_label_sets', 'Distinct label sets without their own series because the label budget is exhausted', ['metric'])
+
+# Disk metrics
+solana_disk_directory_bytes = summable(Gauge('solana_disk_directory_bytes', 'Total size of files under a validator directory in bytes', ['directory']))
+solana_disk_directory_files = summable(Gauge('solana_disk_directory_files', 'Number of files under a validator directory', ['directory']))
+solana_disk_rescanned_directories = Gauge('solana_disk_rescanned_directories', 'Directories rescanned in the last completed scan because their mtime changed', ['directory'])
+solana_disk_filesystem_size_bytes = Gauge('solana_disk_filesystem_size_bytes', 'Size of the filesystem holding a validator directory in bytes', ['directory'])
+solana_disk_filesystem_used_bytes = Gauge('solana_disk_filesystem_used_bytes', 'Used space of the filesystem holding a validator directory in bytes', ['directory'])
+solana_rocksdb_sst_files = summable(Gauge('solana_rocksdb_sst_files', 'Number of RocksDB SST files under a validator directory', ['directory']))
+solana_rocksdb_sst_bytes = summable(Gauge('solana_rocksdb_sst_bytes', 'Total size of RocksDB SST files under a validator directory in bytes', ['directory']))
+
+# Commitment latency metrics
+solana_commitment_slot = retained(Gauge('solana_commitment_slot', 'Highest slot seen at each commitment level', ['endpoint', 'commitment']))
+solana_commitment_delay = Histogram(
+    'solana_commitment_delay_seconds',
+    'Time for a slot to move between commitment levels',
+    ['endpoint', 'stage'],
+    buckets=(0.2, 0.4, 0.8, 1.2, 1.6, 2.4, 3.2, 6.4, 12.8, 16, 20, 25.6, 51.2)
+)
+solana_commitment_delay_diff = Gauge('solana_commitment_delay_diff_seconds', 'Median commitment delay of your RPC minus that of the reference network', ['stage'])
+
+# Prioritization fee metrics
+solana_prioritization_fee = retained(Gauge('solana_prioritization_fee', 'Prioritization fee percentiles over the rolling slot window in micro-lamports per compute unit', ['account_set', 'quantile']))
+solana_prioritization_fee_nonzero_ratio = retained(Gauge('solana_prioritization_fee_nonzero_ratio', 'Fraction of slots in the rolling window with a non-zero prioritization fee', ['account_set']))
+solana_prioritization_fee_slots = retained(Gauge('solana_prioritization_fee_slots', 'Number of slots in the prioritization fee rolling window', ['account_set']))
+
+# Gossip metrics
+solana_cluster_nodes = Gauge('solana_cluster_nodes', 'Number of nodes visible in gossip')
+solana_cluster_rpc_nodes = Gauge('solana_cluster_rpc_nodes', 'Number of nodes in gossip advertising an RPC endpoint')
+solana_cluster_node_versions = retained(summable(Gauge('solana_cluster_node_versions', 'Number of nodes in gossip by software version', ['version'])))
+solana_node_in_gossip = Gauge('solana_node_in_gossip', 'Whether your RPC node identity is visible in gossip (1=visible, 0=missing)')
+solana_gossip_events = Counter('solana_gossip_events', 'Gossip membership changes between snapshots', ['event'])
+
+# Account watch-list metrics
+solana_account_balance = retained(summable(Gauge('solana_account_balance', 'Balance of a watched account in lamports', ['account'])))
+solana_account_exists = retained(summable(Gauge('solana_account_exists', 'Whether a watched account exists (1=exists, 0=missing)', ['account'])))
+solana_account_last_change_slot = retained(Gauge('solana_account_last_change_slot', 'Context slot at which a change of a watched account was detected', ['account']))
+solana_account_changes = Counter('solana_account_changes', 'Detected changes of watched accounts', ['account', 'change'])
@@ -4,6 +4,12 @@ from .tx_monitor import get_transaction_stats, get_transaction_types
 from .version import get_version
 from .websocket_monitor import check_websocket_health
 from .epoch_monitor import get_epoch_info
+from .vote_monitor import get_vote_accounts
+from .disk_monitor import get_disk_usage
+from .commitment_monitor import get_commitment_latency, run_commitment_tracker
+from .fee_monitor import get_prioritization_fees
+from .gossip_monitor import get_cluster_nodes
+from .account_monitor import get_watched_accounts
 #from .block_time_monitor import get_block_time
 
 __all__ = [
@@ -26,5 +32,24 @@ __all__ = [
     'check_websocket_health',
     
     # Epoch monitoring
-    'get_epoch_info'
+    'get_epoch_info',
+
+    # Vote account monitoring
+    'get_vote_accounts',
+
+    # Disk monitoring
+    'get_disk_usage',
+
+    # Commitment latency monitoring
+    'get_commitment_latency',
+    'run_commitment_tracker',
+
+    # Prioritization fee monitoring
+    'get_prioritization_fees',
+
+    # Gossip monitoring
+    'get_cluster_nodes',
+
+    # Account watch-list monitoring
+    'get_watched_accounts'
 ]
\ No newline at end of file
@@ -0,0 +1,145 @@
+# modules/account_monitor.py
+import asyncio
+import zlib
+from typing import NamedTuple
+import aiohttp
+from loguru import logger
+from config import SOLANA_RPC_ENDPOINT, ACCOUNT_WATCH_LIST, ACCOUNT_WATCH_CONCURRENCY, ACCOUNT_DATA_SLICE
+from utils.func import update_metric, increment_metric
+from utils.rpc import rpc_request
+from utils.cardinality import reserve_watch_list
+from metrics.metrics import (
+    solana_account_balance, solana_account_exists,
+    solana_account_last_change_slot, solana_account_changes
+)
+
+# Maximum number of keys accepted by getMultipleAccounts
+MAX_KEYS_PER_REQUEST = 100
+
+ACCOUNT_CHANGES = ("created", "closed", "lamports", "owner", "data")
+
+for metric in (solana_account_balance, solana_account_exists, solana_account_last_change_slot):
+    reserve_watch_list(metric, len(ACCOUNT_WATCH_LIST))
+reserve_watch_list(solana_account_changes, len(ACCOUNT_WATCH_LIST) * len(ACCOUNT_CHANGES))
+
+
+class AccountState(NamedTuple):
+    lamports: int
+    owner: str
+    space: int
+    data_hash: int
+
+
+# Last known state per watched account; None means the account does not exist
+_states = {}
+
+
+def _parse_account(account):
+    """Reduce a getMultipleAccounts entry to the fields used for change detection"""
+    if account is None:
+        return None
+    data = account.get("data") or [""]
+    return AccountState(
+        lamports=account.get("lamports", 0),
+        owner=account.get("owner", ""),
+        space=account.get("space", 0),
+        data_hash=zlib.crc32(data[0].encode()) if ACCOUNT_DATA_SLICE else 0
+    )
+
+
+def _detect_changes(old_state, state):
+    """List the kinds of change between two states of an account"""
+    if old_state is None:
+        return ["created"]
+    if state is None:
+        return ["closed"]
+    changes = []
+    if old_state.lamports != state.lamports:
+        changes.append("lamports")
+    if old_state.owner != state.owner:
+        changes.append("owner")
+    if old_state.space != state.space or old_state.data_hash != state.data_hash:
+        changes.append("data")
+    return changes
+
+
+def _update_account(pubkey, state, slot):
+    """Write the series of one account if it changed since the last cycle"""
+    first_seen = pubkey not in _states
+    old_state = _states.get(pubkey)
+    if not first_seen and old_state == state:
+        return 0
+
+    _states[pubkey] = state
+    labels = {"account": pubkey}
+    update_metric(solana_account_exists, int(state is not None), labels=labels)
+    update_metric(solana_account_balance, state.lamports if state else 0, labels=labels)
+
+    # The first observation only establishes the baseline
+    if first_seen:
+        return 0
+
+    for change in _detect_changes(old_state, state):
+        increment_metric(solana_account_changes, 1, labels={"account": pubkey, "change": change})
+    update_metric(solana_account_last_change_slot, slot, labels=labels)
+    return 1
+
+
+async def _fetch_chunk(session, pubkeys, semaphore):
+    """Fetch one chunk of accounts without downloading more data than hashed"""
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getMultipleAccounts",
+        "params": [
+            pubkeys,
+            {
+                "encoding": "base64",
+                "commitment": "confirmed",
+                "dataSlice": {"offset": 0, "length": ACCOUNT_DATA_SLICE}
+            }
+        ]
+    }
+
+    async with semaphore:
+        result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+
+    if "result" not in result:
+        raise RuntimeError(result.get("error", "unexpected response"))
+
+    slot = result["result"]["context"]["slot"]
+    changed = 0
+    for pubkey, account in zip(pubkeys, result["result"]["value"]):
+        changed += _update_account(pubkey, _parse_account(account), slot)
+    return changed
+
+
+async def get_watched_accounts():
+    """Get balances and change signals for the account watch-list"""
+    if not ACCOUNT_WATCH_LIST:
+        return
+
+    try:
+        semaphore = asyncio.Semaphore(ACCOUNT_WATCH_CONCURRENCY)
+        chunks = [
+            ACCOUNT_WATCH_LIST[index:index + MAX_KEYS_PER_REQUEST]
+            for index in range(0, len(ACCOUNT_WATCH_LIST), MAX_KEYS_PER_REQUEST)
+        ]
+
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *(_fetch_chunk(session, chunk, semaphore) for chunk in chunks),
+                return_exceptions=True
+            )
+
+        changed = 0
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting {len(chunk)} watched accounts: {result}")
+            else:
+                changed += result
+
+        logger.info(f"Watched accounts - Total: {len(ACCOUNT_WATCH_LIST)}, Changed: {changed}")
+
+    except Exception as e:
+        logger.error(f"Error getting watched accounts: {e}")
@@ -1,8 +1,10 @@
 import aiohttp
 import time
 from loguru import logger
-from config import SOLANA_RPC_ENDPOINT, HEADERS
+from config import SOLANA_RPC_ENDPOINT
 from utils.func import update_metric
+from utils.rpc import rpc_request
+from utils.readiness import record_signal
 from metrics.metrics import solana_block_time, solana_block_time_diff
 
 async def get_block_time():
@@ -17,8 +19,7 @@ async def get_block_time():
         }
 
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=slot_payload, headers=HEADERS) as response:
-                slot_result = await response.json()
+            slot_result = await rpc_request(session, SOLANA_RPC_ENDPOINT, slot_payload)
                 
             if "result" not in slot_result:
                 logger.error("Failed to get current slot")
@@ -34,8 +35,7 @@ async def get_block_time():
                 "params": [current_slot]
             }
 
-            async with session.post(SOLANA_RPC_ENDPOINT, json=block_time_payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, block_time_payload)
 
             if "result" in result:
                 block_time = result["result"]
@@ -45,6 +45,7 @@ async def get_block_time():
                 # Update metrics
                 update_metric(solana_block_time, block_time)
                 update_metric(solana_block_time_diff, time_diff)
+                record_signal("block_time_lag", time_diff)
 
                 logger.info(f"Block time - Slot: {current_slot}, Time diff: {time_diff}s")
             else:
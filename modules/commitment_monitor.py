@@ -0,0 +1,166 @@
+# modules/commitment_monitor.py
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+import aiohttp
+import websockets
+from loguru import logger
+from config import (
+    SOLANA_RPC_ENDPOINT, NETWORK_RPC_ENDPOINT, SOLANA_WS_ENDPOINT, NETWORK_WS_ENDPOINT,
+    COMMITMENT_POLL_INTERVAL, COMMITMENT_TRACKED_SLOTS
+)
+from utils.func import update_metric, percentiles
+from utils.rpc import rpc_request
+from metrics.metrics import solana_commitment_slot, solana_commitment_delay, solana_commitment_delay_diff
+
+LEVELS = ("processed", "confirmed", "finalized")
+STAGES = ("processed_to_confirmed", "confirmed_to_finalized")
+
+# Delays kept per stage for comparing endpoints
+RECENT_DELAYS = 128
+
+WS_RECONNECT_DELAY = 5
+
+
+class CommitmentTracker:
+    """Arrival times of slots at each commitment level for one endpoint"""
+
+    def __init__(self, endpoint, max_slots):
+        self.endpoint = endpoint
+        self.max_slots = max_slots
+        # slot -> [processed, confirmed, finalized] arrival times, ascending by slot
+        self.slots = OrderedDict()
+        self.highest = dict.fromkeys(LEVELS)
+        self.recent = {stage: deque(maxlen=RECENT_DELAYS) for stage in STAGES}
+
+    def observe(self, level, slot, timestamp):
+        """Record that slot was seen at commitment level at timestamp"""
+        previous = self.highest[level]
+        if previous is not None and slot <= previous:
+            return
+        self.highest[level] = slot
+        update_metric(solana_commitment_slot, slot, labels={"endpoint": self.endpoint, "commitment": level})
+
+        if level == "processed":
+            if slot not in self.slots:
+                self.slots[slot] = [timestamp, None, None]
+                while len(self.slots) > self.max_slots:
+                    self.slots.popitem(last=False)
+            return
+
+        # Slots already at this level before we started watching have no
+        # meaningful arrival time
+        if previous is None:
+            return
+
+        index = LEVELS.index(level)
+        stage = STAGES[index - 1]
+        for tracked_slot, arrivals in self.slots.items():
+            if tracked_slot > slot:
+                break
+            if arrivals[index] is None:
+                arrivals[index] = timestamp
+                if arrivals[index - 1] is not None:
+                    delay = timestamp - arrivals[index - 1]
+                    solana_commitment_delay.labels(endpoint=self.endpoint, stage=stage).observe(delay)
+                    self.recent[stage].append(delay)
+
+        if level == "finalized":
+            while self.slots and next(iter(self.slots)) <= slot:
+                self.slots.popitem(last=False)
+
+    def median_delay(self, stage):
+        """Median of the recent delays for stage, None if nothing was observed"""
+        return percentiles(sorted(self.recent[stage]), (0.5,)).get(0.5)
+
+
+local_tracker = CommitmentTracker("local", COMMITMENT_TRACKED_SLOTS)
+network_tracker = CommitmentTracker("network", COMMITMENT_TRACKED_SLOTS)
+
+
+async def _poll_commitment_slots(session, endpoint, tracker):
+    """Poll getSlot at every commitment level in one batch request"""
+    payload = [
+        {"jsonrpc": "2.0", "id": index, "method": "getSlot", "params": [{"commitment": level}]}
+        for index, level in enumerate(LEVELS)
+    ]
+
+    while True:
+        try:
+            start_time = time.monotonic()
+            results = await rpc_request(session, endpoint, payload, cache=False)
+            # Timestamp at the midpoint of the round trip
+            timestamp = (start_time + time.monotonic()) / 2
+
+            for result in sorted(results, key=lambda item: item.get("id", 0)):
+                if "result" in result:
+                    tracker.observe(LEVELS[result["id"]], result["result"], timestamp)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.debug(f"Error polling commitment slots from {tracker.endpoint} endpoint: {e}")
+
+        await asyncio.sleep(COMMITMENT_POLL_INTERVAL)
+
+
+async def _stream_processed_slots(ws_endpoint, tracker):
+    """Record processed slot arrivals from slotSubscribe notifications"""
+    subscription_payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "slotSubscribe"
+    }
+
+    while True:
+        try:
+            async with websockets.connect(ws_endpoint) as websocket:
+                await websocket.send(json.dumps(subscription_payload))
+                logger.info(f"Tracking processed slots from {ws_endpoint}")
+                async for message in websocket:
+                    timestamp = time.monotonic()
+                    notification = json.loads(message)
+                    slot_info = notification.get("params", {}).get("result")
+                    if slot_info:
+                        tracker.observe("processed", slot_info["slot"], timestamp)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Slot subscription to {ws_endpoint} failed: {e}")
+
+        await asyncio.sleep(WS_RECONNECT_DELAY)
+
+
+async def run_commitment_tracker():
+    """
+    Track commitment propagation of your RPC and the reference network in the background.
+
+    Both endpoints are observed the same way: processed slots are streamed
+    from slotSubscribe and every level is polled, so neither side carries
+    a sampling delay the other lacks when their delays are compared.
+    """
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(
+            _stream_processed_slots(SOLANA_WS_ENDPOINT, local_tracker),
+            _stream_processed_slots(NETWORK_WS_ENDPOINT, network_tracker),
+            _poll_commitment_slots(session, SOLANA_RPC_ENDPOINT, local_tracker),
+            _poll_commitment_slots(session, NETWORK_RPC_ENDPOINT, network_tracker)
+        )
+
+
+async def get_commitment_latency():
+    """Compare recent commitment delays of your RPC against the reference network"""
+    try:
+        for stage in STAGES:
+            local_delay = local_tracker.median_delay(stage)
+            network_delay = network_tracker.median_delay(stage)
+            if local_delay is None or network_delay is None:
+                continue
+
+            update_metric(solana_commitment_delay_diff, local_delay - network_delay, labels={"stage": stage})
+            logger.info(f"Commitment {stage} - Local: {local_delay:.2f}s, Network: {network_delay:.2f}s")
+
+    except Exception as e:
+        logger.error(f"Error getting commitment latency: {e}")
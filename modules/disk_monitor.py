@@ -0,0 +1,188 @@
+# modules/disk_monitor.py
+import asyncio
+import os
+import shutil
+from loguru import logger
+from config import LEDGER_PATH, ACCOUNTS_PATH, DISK_FULL_SCAN_INTERVAL, SLEEP_TIME
+from utils.func import update_metric, Cadence
+from utils.rpc import collection_clock
+from metrics.metrics import (
+    solana_disk_directory_bytes, solana_disk_directory_files,
+    solana_disk_rescanned_directories, solana_disk_filesystem_size_bytes,
+    solana_disk_filesystem_used_bytes, solana_rocksdb_sst_files,
+    solana_rocksdb_sst_bytes
+)
+
+SST_SUFFIX = ".sst"
+
+
+class DirectoryNode:
+    """Cached listing of one directory and the totals of its subtree"""
+
+    __slots__ = (
+        "mtime", "file_count", "file_bytes", "sst_count", "sst_bytes",
+        "children", "totals"
+    )
+
+    def __init__(self):
+        self.mtime = None
+        self.file_count = 0
+        self.file_bytes = 0
+        self.sst_count = 0
+        self.sst_bytes = 0
+        self.children = {}
+        self.totals = (0, 0, 0, 0)
+
+
+class DirectoryTree:
+    """
+    Size accounting for a directory tree that only rescans changed directories.
+
+    A directory is listed again only when its mtime changed, i.e. when files
+    were created, removed or renamed in it. Files growing in place (RocksDB
+    logs, accounts storage) keep their cached size until the directory
+    changes or the next full scan.
+
+    Refreshes run in a worker thread; the cached tree must only be touched
+    by one refresh at a time.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.root = None
+        self.rescanned = 0
+
+    def refresh(self, full=False):
+        """
+        Bring the cached tree up to date.
+
+        Returns:
+            Tuple of (file count, file bytes, SST count, SST bytes)
+        """
+        self.rescanned = 0
+        self.root = self._refresh(self.path, self.root, full)
+        return self.root.totals
+
+    def _refresh(self, path, node, full):
+        mtime = os.stat(path).st_mtime_ns
+        if node is None or full or node.mtime != mtime:
+            node = self._rescan(path, node, mtime)
+
+        file_count, file_bytes = node.file_count, node.file_bytes
+        sst_count, sst_bytes = node.sst_count, node.sst_bytes
+        for name, child in list(node.children.items()):
+            try:
+                child = self._refresh(os.path.join(path, name), child, full)
+            except (FileNotFoundError, NotADirectoryError):
+                del node.children[name]
+                continue
+            node.children[name] = child
+            file_count += child.totals[0]
+            file_bytes += child.totals[1]
+            sst_count += child.totals[2]
+            sst_bytes += child.totals[3]
+
+        node.totals = (file_count, file_bytes, sst_count, sst_bytes)
+        return node
+
+    def _rescan(self, path, previous, mtime):
+        self.rescanned += 1
+        node = DirectoryNode()
+        # Record the mtime seen before listing so changes made during the
+        # scan are picked up next cycle
+        node.mtime = mtime
+        previous_children = previous.children if previous else {}
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        node.children[entry.name] = previous_children.get(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        size = entry.stat(follow_symlinks=False).st_size
+                        node.file_count += 1
+                        node.file_bytes += size
+                        if entry.name.endswith(SST_SUFFIX):
+                            node.sst_count += 1
+                            node.sst_bytes += size
+                except FileNotFoundError:
+                    # Removed between listing and stat (e.g. compaction)
+                    continue
+
+        return node
+
+
+_trees = {}
+# Totals of the last completed scan per directory:
+# (file count, file bytes, SST count, SST bytes, rescanned directories)
+_scans = {}
+_full_scan = Cadence(DISK_FULL_SCAN_INTERVAL, collection_clock)
+
+
+def _directories():
+    """Configured validator directories keyed by metric label"""
+    return {name: path for name, path in (("ledger", LEDGER_PATH), ("accounts", ACCOUNTS_PATH)) if path}
+
+
+def _scan(name, path, full):
+    tree = _trees.get(name)
+    if tree is None:
+        tree = _trees[name] = DirectoryTree(path)
+    return (*tree.refresh(full), tree.rescanned)
+
+
+async def run_disk_scanner():
+    """
+    Keep the directory trees up to date in the background.
+
+    A full walk of a large ledger can take minutes, so it must not hold up
+    the collection cycle; get_disk_usage publishes the last completed scan.
+    """
+    directories = _directories()
+    if not directories:
+        return
+
+    while True:
+        full = _full_scan.due()
+        for name, path in directories.items():
+            try:
+                # Directory walking is blocking I/O, keep it off the event loop
+                _scans[name] = await asyncio.to_thread(_scan, name, path, full)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error scanning {name} directory {path}: {e}")
+        if full:
+            _full_scan.mark()
+
+        await asyncio.sleep(SLEEP_TIME)
+
+
+async def get_disk_usage():
+    """Get ledger and accounts directory sizes and RocksDB SST statistics"""
+    for name, path in _directories().items():
+        try:
+            usage = shutil.disk_usage(path)
+            labels = {"directory": name}
+            update_metric(solana_disk_filesystem_size_bytes, usage.total, labels=labels)
+            update_metric(solana_disk_filesystem_used_bytes, usage.used, labels=labels)
+
+            scan = _scans.get(name)
+            if scan is None:
+                logger.debug(f"Disk usage - {name}: first scan still running")
+                continue
+
+            file_count, file_bytes, sst_count, sst_bytes, rescanned = scan
+            update_metric(solana_disk_directory_files, file_count, labels=labels)
+            update_metric(solana_disk_directory_bytes, file_bytes, labels=labels)
+            update_metric(solana_disk_rescanned_directories, rescanned, labels=labels)
+            update_metric(solana_rocksdb_sst_files, sst_count, labels=labels)
+            update_metric(solana_rocksdb_sst_bytes, sst_bytes, labels=labels)
+
+            logger.info(
+                f"Disk usage - {name}: {file_bytes / 1024 ** 3:.2f} GiB in {file_count} files, "
+                f"SST: {sst_count} files, rescanned {rescanned} directories"
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting disk usage for {name} directory {path}: {e}")
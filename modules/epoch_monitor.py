@@ -1,7 +1,8 @@
 import aiohttp
 from loguru import logger
-from config import SOLANA_RPC_ENDPOINT, HEADERS
+from config import SOLANA_RPC_ENDPOINT
 from utils.func import update_metric
+from utils.rpc import rpc_request
 from metrics.metrics import (
     solana_network_epoch,
     solana_slot_in_epoch,
@@ -20,8 +21,7 @@ async def get_epoch_info():
 
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
 
             if "result" in result:
                 epoch_info = result["result"]
@@ -44,8 +44,7 @@ async def get_epoch_info():
                 "method": "getHighestSnapshotSlot"
             }
 
-            async with session.post(SOLANA_RPC_ENDPOINT, json=highest_slot_payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, highest_slot_payload)
 
             if "result" in result:
                 highest_slot = result["result"].get("full", 0)
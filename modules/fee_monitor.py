@@ -0,0 +1,134 @@
+# modules/fee_monitor.py
+import asyncio
+from array import array
+import aiohttp
+import numpy as np
+from loguru import logger
+from config import SOLANA_RPC_ENDPOINT, FEE_ACCOUNT_SETS, FEE_WINDOW_SLOTS
+from utils.func import update_metric
+from utils.rpc import rpc_request
+from utils.cardinality import reserve_watch_list
+from metrics.metrics import (
+    solana_prioritization_fee, solana_prioritization_fee_nonzero_ratio,
+    solana_prioritization_fee_slots
+)
+
+FEE_QUANTILES = (0.25, 0.5, 0.75, 0.9, 0.99)
+FEE_QUANTILES_PERCENT = [quantile * 100 for quantile in FEE_QUANTILES]
+
+GLOBAL_SET = "global"
+
+# getRecentPrioritizationFees accepts at most this many accounts
+MAX_FEE_ACCOUNTS = 128
+
+reserve_watch_list(solana_prioritization_fee, (len(FEE_ACCOUNT_SETS) + 1) * len(FEE_QUANTILES))
+for metric in (solana_prioritization_fee_nonzero_ratio, solana_prioritization_fee_slots):
+    reserve_watch_list(metric, len(FEE_ACCOUNT_SETS) + 1)
+
+
+class FeeWindow:
+    """Rolling window of per-slot prioritization fees in a fixed-size array"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.fees = array("Q", bytes(8 * capacity))
+        self.size = 0
+        self.head = 0
+        self.last_slot = -1
+
+    def extend(self, samples):
+        """
+        Add samples for slots not seen before.
+
+        Args:
+            samples: getRecentPrioritizationFees result entries
+
+        Returns:
+            Number of new slots added
+        """
+        added = 0
+        for sample in sorted(samples, key=lambda item: item["slot"]):
+            if sample["slot"] <= self.last_slot:
+                continue
+            self.fees[self.head] = sample["prioritizationFee"]
+            self.head = (self.head + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+            self.last_slot = sample["slot"]
+            added += 1
+        return added
+
+    def summary(self):
+        """
+        Percentiles and share of non-zero fees over the window.
+
+        The array buffer is viewed in place and all quantiles come from one
+        nearest-rank (inverted CDF) pass.
+        """
+        if not self.size:
+            return {}, 0
+        window = np.frombuffer(self.fees, np.uint64)[:self.size]
+        values = np.percentile(window, FEE_QUANTILES_PERCENT, method="inverted_cdf")
+        fee_percentiles = {quantile: int(value) for quantile, value in zip(FEE_QUANTILES, values)}
+        return fee_percentiles, np.count_nonzero(window) / self.size
+
+
+_windows = {}
+
+
+def _account_sets():
+    """Global fee market plus the configured account sets"""
+    account_sets = {GLOBAL_SET: []}
+    for name, accounts in FEE_ACCOUNT_SETS.items():
+        if len(accounts) > MAX_FEE_ACCOUNTS:
+            logger.warning(f"Fee account set {name} has {len(accounts)} accounts, using the first {MAX_FEE_ACCOUNTS}")
+        account_sets[name] = accounts[:MAX_FEE_ACCOUNTS]
+    return account_sets
+
+
+async def _update_fee_window(session, name, accounts):
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getRecentPrioritizationFees",
+        "params": [accounts] if accounts else []
+    }
+
+    result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+    if "result" not in result:
+        logger.error(f"Failed to get prioritization fees for {name}: {result.get('error')}")
+        return
+
+    window = _windows.get(name)
+    if window is None:
+        window = _windows[name] = FeeWindow(FEE_WINDOW_SLOTS)
+
+    if not window.extend(result["result"]):
+        return
+
+    fee_percentiles, nonzero_ratio = window.summary()
+    for quantile, fee in fee_percentiles.items():
+        update_metric(solana_prioritization_fee, fee, labels={"account_set": name, "quantile": str(quantile)})
+    update_metric(solana_prioritization_fee_nonzero_ratio, nonzero_ratio, labels={"account_set": name})
+    update_metric(solana_prioritization_fee_slots, window.size, labels={"account_set": name})
+
+    logger.info(
+        f"Prioritization fees - {name}: p50 {fee_percentiles.get(0.5)}, p90 {fee_percentiles.get(0.9)}, "
+        f"non-zero {nonzero_ratio:.0%} over {window.size} slots"
+    )
+
+
+async def get_prioritization_fees():
+    """Get prioritization fee percentiles globally and for the configured account sets"""
+    try:
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *(_update_fee_window(session, name, accounts) for name, accounts in _account_sets().items()),
+                return_exceptions=True
+            )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error getting prioritization fees: {result}")
+
+    except Exception as e:
+        logger.error(f"Error getting prioritization fees: {e}")
@@ -0,0 +1,143 @@
+# modules/gossip_monitor.py
+from collections import Counter
+from typing import NamedTuple, Optional
+import aiohttp
+from loguru import logger
+from config import SOLANA_RPC_ENDPOINT, GOSSIP_INTERVAL
+from utils.func import update_metric, increment_metric, remove_metric, diff_snapshots, Cadence
+from utils.rpc import rpc_request, collection_clock
+from metrics.metrics import (
+    solana_cluster_nodes, solana_cluster_rpc_nodes, solana_cluster_node_versions,
+    solana_node_in_gossip, solana_gossip_events
+)
+
+UNKNOWN_VERSION = "unknown"
+
+
+class GossipNode(NamedTuple):
+    version: str
+    rpc: bool
+    shred_version: Optional[int]
+
+
+# Last getClusterNodes snapshot keyed by identity pubkey, and aggregates
+# maintained from the diffs between snapshots
+_index = {}
+_version_counts = Counter()
+_rpc_nodes = 0
+_identity = None
+_cadence = Cadence(GOSSIP_INTERVAL, collection_clock)
+
+
+def _parse_cluster_node(node):
+    """Reduce a getClusterNodes entry to the fields we track"""
+    return GossipNode(
+        version=node.get("version") or UNKNOWN_VERSION,
+        rpc=node.get("rpc") is not None,
+        shred_version=node.get("shredVersion")
+    )
+
+
+def _apply(state, delta):
+    """Add (delta=1) or remove (delta=-1) a node from the aggregates"""
+    global _rpc_nodes
+    _version_counts[state.version] += delta
+    if state.rpc:
+        _rpc_nodes += delta
+
+
+def _apply_diff(previous, snapshot, changed, removed, baseline):
+    """
+    Update aggregates and event counters from the changed and removed nodes.
+
+    Returns:
+        Set of versions whose node count changed
+    """
+    events = Counter()
+    touched_versions = set()
+
+    for pubkey in removed:
+        state = previous[pubkey]
+        _apply(state, -1)
+        touched_versions.add(state.version)
+        events["leave"] += 1
+
+    for pubkey in changed:
+        state = snapshot[pubkey]
+        old_state = previous.get(pubkey)
+        if old_state is None:
+            events["join"] += 1
+        else:
+            _apply(old_state, -1)
+            touched_versions.add(old_state.version)
+            if old_state.version != state.version:
+                events["version_change"] += 1
+        _apply(state, 1)
+        touched_versions.add(state.version)
+
+    # The first snapshot only establishes the baseline
+    if not baseline:
+        for event, count in events.items():
+            increment_metric(solana_gossip_events, count, labels={"event": event})
+        if events:
+            logger.info(f"Gossip changes - {dict(events)}")
+
+    return touched_versions
+
+
+async def _get_identity(session):
+    """Identity pubkey of your RPC node, fetched once"""
+    global _identity
+    if _identity is None:
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "getIdentity"}
+        result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+        if "result" in result:
+            _identity = result["result"].get("identity")
+    return _identity
+
+
+async def get_cluster_nodes():
+    """Collect the gossip cluster view at its own cadence, updating only changed series"""
+    global _index
+
+    if not _cadence.due():
+        return
+
+    payload = {"jsonrpc": "2.0", "id": 1, "method": "getClusterNodes"}
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            identity = await _get_identity(session)
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+
+        if "result" not in result:
+            logger.error(f"Failed to get cluster nodes: {result.get('error')}")
+            return
+
+        snapshot = {node["pubkey"]: _parse_cluster_node(node) for node in result["result"]}
+        changed, removed = diff_snapshots(_index, snapshot)
+        touched_versions = _apply_diff(_index, snapshot, changed, removed, baseline=not _index)
+        _index = snapshot
+        _cadence.mark()
+
+        for version in touched_versions:
+            count = _version_counts[version]
+            if count > 0:
+                update_metric(solana_cluster_node_versions, count, labels={"version": version})
+            else:
+                del _version_counts[version]
+                remove_metric(solana_cluster_node_versions, {"version": version})
+
+        update_metric(solana_cluster_nodes, len(snapshot))
+        update_metric(solana_cluster_rpc_nodes, _rpc_nodes)
+
+        if identity is not None:
+            visible = identity in snapshot
+            update_metric(solana_node_in_gossip, int(visible))
+            if not visible:
+                logger.warning(f"RPC node identity {identity} is not visible in gossip")
+
+        logger.info(f"Gossip - Nodes: {len(snapshot)}, RPC nodes: {_rpc_nodes}, Changed: {len(changed)}, Removed: {len(removed)}")
+
+    except Exception as e:
+        logger.error(f"Error getting cluster nodes: {e}")
@@ -2,34 +2,28 @@
 import aiohttp
 import time
 from loguru import logger
-from config import SOLANA_RPC_ENDPOINT, HEADERS
+from config import SOLANA_RPC_ENDPOINT
 from utils.func import update_metric
+from utils.rpc import rpc_request
+from utils.readiness import record_signal
 from metrics.metrics import (
-    solana_node_health, solana_node_slots_behind,
-    solana_rpc_requests, solana_rpc_errors, solana_rpc_latency
+    solana_node_health, solana_node_slots_behind, solana_rpc_errors
 )
 
 async def get_health():
     """Check the health status of the RPC node and collect performance metrics"""
     try:
         async with aiohttp.ClientSession() as session:
-            # Health check
-            start_time = time.time()
+            # Health check (request latency is tracked by rpc_request)
             health_payload = {
                 "jsonrpc": "2.0", "id": 1, "method": "getHealth"
             }
             
-            async with session.post(SOLANA_RPC_ENDPOINT, json=health_payload, headers=HEADERS) as response:
-                result = await response.json()
-                end_time = time.time()
-                
-                # Update latency metric
-                latency = end_time - start_time
-                update_metric(solana_rpc_latency, latency, labels={"method": "getHealth"})
-                update_metric(solana_rpc_requests, 1, labels={"method": "getHealth"})
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, health_payload)
 
             if "result" in result and result["result"] == "ok":
                 update_metric(solana_node_health, 1, labels={"status": "healthy", "cause": "none"})
+                record_signal("healthy", True)
                 logger.info("RPC node is healthy")
                 last_slots_behind = solana_node_slots_behind._value.get()
                 if last_slots_behind:
@@ -38,6 +32,7 @@ async def get_health():
                 error_message = result["error"].get("message", "Unknown error")
                 slots_behind = result["error"]["data"].get("numSlotsBehind", 0)
                 update_metric(solana_node_health, 0, labels={"status": "unhealthy", "cause": "slots_behind"})
+                record_signal("healthy", False)
                 update_metric(solana_node_slots_behind, slots_behind)
                 update_metric(solana_rpc_errors, 1, labels={"method": "getHealth"})
                 # Enhanced logging for unhealthy state with slots behind
@@ -50,10 +45,13 @@ async def get_health():
             else:
                 logger.error("Unexpected response format")
                 update_metric(solana_node_health, 0, labels={"status": "unhealthy", "cause": "unknown"})
+                record_signal("healthy", False)
 
     except aiohttp.ClientError as e:
         logger.error(f"Network error occurred while fetching node health: {e}")
         update_metric(solana_node_health, 0, labels={"status": "unhealthy", "cause": "network_error"})
+        record_signal("healthy", False)
     except Exception as e:
         logger.error(f"Error getting node health: {e}")
         update_metric(solana_node_health, 0, labels={"status": "unhealthy", "cause": "unknown"})
+        record_signal("healthy", False)
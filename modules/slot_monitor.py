@@ -1,18 +1,33 @@
 # modules/slot_monitor.py
-import aiohttp, time
+import asyncio
+import aiohttp
 from loguru import logger
-from config import SOLANA_RPC_ENDPOINT, NETWORK_RPC_ENDPOINT, HEADERS
 from utils.func import update_metric
+from utils.sampling import RateEstimator, paired_request
+from utils.readiness import record_signal
 from metrics.metrics import (
     solana_current_slot, solana_net_current_slot, solana_slot_diff,
     solana_block_height, solana_network_block_height, solana_block_height_diff,
     solana_max_shred_insert_slot, solana_max_retransmit_slot,
     solana_net_max_shred_insert_slot, solana_net_max_retransmit_slot,
-    solana_rpc_requests, solana_rpc_errors, solana_rpc_latency
+    solana_max_shred_insert_slot_diff, solana_max_retransmit_slot_diff,
+    solana_paired_probe_skew, solana_slot_rate
 )
 
-async def get_shred_slots(session, endpoint, is_network=False):
-    """Get shred insert and retransmit slots for the specified endpoint"""
+# Observed network progress, used to align paired samples in time
+slot_rate = RateEstimator()
+block_height_rate = RateEstimator()
+
+
+def _corrected_lag(sample, rate, method):
+    """Lag of a paired sample corrected for the time between its responses"""
+    diff = sample.corrected_diff(rate.rate)
+    update_metric(solana_paired_probe_skew, sample.skew, labels={"method": method})
+    return round(diff, 2) if diff is not None else None
+
+
+async def get_shred_slots(session):
+    """Get shred insert and retransmit slots from both endpoints with paired probes"""
     payloads = [
         {
             "jsonrpc": "2.0",
@@ -27,44 +42,31 @@ async def get_shred_slots(session, endpoint, is_network=False):
     ]
 
     try:
-        results = []
-        for payload in payloads:
-            start_time = time.time()
-            async with session.post(endpoint, json=payload, headers=HEADERS) as response:
-                result = await response.json()
-                end_time = time.time()
-                
-                # Update latency and request metrics
-                latency = end_time - start_time
-                method = payload["method"]
-                update_metric(solana_rpc_latency, latency, labels={"method": method})
-                update_metric(solana_rpc_requests, 1, labels={"method": method})
-                
-                if "error" in result:
-                    update_metric(solana_rpc_errors, 1, labels={"method": method})
-                results.append(result)
+        # Request latency and error metrics are tracked by rpc_request
+        shred_insert, retransmit = await asyncio.gather(
+            *(paired_request(session, payload) for payload in payloads)
+        )
+
         # Process shred insert slot
-        if "result" in results[0]:
-            shred_insert_slot = results[0]["result"]
-            if is_network:
-                update_metric(solana_net_max_shred_insert_slot, shred_insert_slot)
-                logger.debug(f"Network max shred insert slot: {shred_insert_slot}")
-            else:
-                update_metric(solana_max_shred_insert_slot, shred_insert_slot)
-                logger.debug(f"Local max shred insert slot: {shred_insert_slot}")
+        shred_insert_slot = shred_insert.local.get("result")
+        net_shred_insert_slot = shred_insert.network.get("result")
+        update_metric(solana_max_shred_insert_slot, shred_insert_slot)
+        update_metric(solana_net_max_shred_insert_slot, net_shred_insert_slot)
+        shred_insert_diff = _corrected_lag(shred_insert, slot_rate, "getMaxShredInsertSlot")
+        update_metric(solana_max_shred_insert_slot_diff, shred_insert_diff)
+        logger.debug(f"Max shred insert slot - Local: {shred_insert_slot}, Network: {net_shred_insert_slot}, Diff: {shred_insert_diff}")
 
         # Process retransmit slot
-        if "result" in results[1]:
-            retransmit_slot = results[1]["result"]
-            if is_network:
-                update_metric(solana_net_max_retransmit_slot, retransmit_slot)
-                logger.debug(f"Network max retransmit slot: {retransmit_slot}")
-            else:
-                update_metric(solana_max_retransmit_slot, retransmit_slot)
-                logger.debug(f"Local max retransmit slot: {retransmit_slot}")
+        retransmit_slot = retransmit.local.get("result")
+        net_retransmit_slot = retransmit.network.get("result")
+        update_metric(solana_max_retransmit_slot, retransmit_slot)
+        update_metric(solana_net_max_retransmit_slot, net_retransmit_slot)
+        retransmit_diff = _corrected_lag(retransmit, slot_rate, "getMaxRetransmitSlot")
+        update_metric(solana_max_retransmit_slot_diff, retransmit_diff)
+        logger.debug(f"Max retransmit slot - Local: {retransmit_slot}, Network: {net_retransmit_slot}, Diff: {retransmit_diff}")
 
     except Exception as e:
-        logger.error(f"Error getting shred slots from {'network' if is_network else 'local'} endpoint: {e}")
+        logger.error(f"Error getting shred slots: {e}")
 
 async def get_slot_info():
     """Get slot information from both RPC nodes"""
@@ -77,41 +79,33 @@ async def get_slot_info():
 
     try:
         async with aiohttp.ClientSession() as session:
-            # Get slots from both endpoints
-            start_time = time.time()
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                rpc_result = await response.json()
-                end_time = time.time()
-                # Update latency and request metrics
-                latency = end_time - start_time
-                update_metric(solana_rpc_latency, latency, labels={"method": "getSlot"})
-                update_metric(solana_rpc_requests, 1, labels={"method": "getSlot"})
-                
-                current_slot = rpc_result.get('result')
-                logger.debug(f"Local RPC slot: {current_slot}")
-                if current_slot is not None:
-                    update_metric(solana_current_slot, current_slot)
-
-            async with session.post(NETWORK_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                network_result = await response.json()
-                network_slot = network_result.get('result')
-                logger.debug(f"Network RPC slot: {network_slot}")
-                if network_slot is not None:
-                    update_metric(solana_net_current_slot, network_slot)
-
-            # Calculate and log slot difference
-            if current_slot is not None and network_slot is not None:
-                slot_diff = current_slot - network_slot
+            # Query both endpoints at the same time
+            sample = await paired_request(session, payload)
+
+            current_slot = sample.local.get('result')
+            logger.debug(f"Local RPC slot: {current_slot}")
+            if current_slot is not None:
+                update_metric(solana_current_slot, current_slot)
+
+            network_slot = sample.network.get('result')
+            logger.debug(f"Network RPC slot: {network_slot}")
+            if network_slot is not None:
+                update_metric(solana_net_current_slot, network_slot)
+                update_metric(solana_slot_rate, slot_rate.update(network_slot, sample.network_time), labels={"series": "slot"})
+
+            # Calculate and log slot difference, corrected for sampling skew
+            slot_diff = _corrected_lag(sample, slot_rate, "getSlot")
+            if slot_diff is not None:
                 update_metric(solana_slot_diff, slot_diff)
+                record_signal("slot_lag", max(0, -slot_diff))
                 if abs(slot_diff) > 100:
                     logger.warning(f"Large slot difference detected: {slot_diff} slots")
                     logger.warning(f"Local slot: {current_slot}, Network slot: {network_slot}")
                 else:
-                    logger.info(f"Slot difference: {slot_diff}")
+                    logger.info(f"Slot difference: {slot_diff} (skew {sample.skew * 1000:.0f}ms)")
 
             # Get shred slots for both endpoints
-            await get_shred_slots(session, SOLANA_RPC_ENDPOINT, False)
-            await get_shred_slots(session, NETWORK_RPC_ENDPOINT, True)
+            await get_shred_slots(session)
 
     except Exception as e:
         logger.error(f"Error getting slot information: {e}")
@@ -127,31 +121,23 @@ async def get_block_heights():
 
     try:
         async with aiohttp.ClientSession() as session:
-            # Get block heights from both endpoints
-            start_time = time.time()
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                rpc_result = await response.json()
-                end_time = time.time()
-                # Update latency and request metrics
-                latency = end_time - start_time
-                update_metric(solana_rpc_latency, latency, labels={"method": "getBlockHeight"})
-                update_metric(solana_rpc_requests, 1, labels={"method": "getBlockHeight"})
-                
-                rpc_height = rpc_result.get('result')
-                logger.debug(f"Local RPC block height: {rpc_height}")
-                if rpc_height is not None:
-                    update_metric(solana_block_height, rpc_height)
-
-            async with session.post(NETWORK_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                network_result = await response.json()
-                network_height = network_result.get('result')
-                logger.debug(f"Network block height: {network_height}")
-                if network_height is not None:
-                    update_metric(solana_network_block_height, network_height)
-
-            # Calculate and log block height difference
-            if rpc_height is not None and network_height is not None:
-                height_diff = rpc_height - network_height
+            # Query both endpoints at the same time
+            sample = await paired_request(session, payload)
+
+            rpc_height = sample.local.get('result')
+            logger.debug(f"Local RPC block height: {rpc_height}")
+            if rpc_height is not None:
+                update_metric(solana_block_height, rpc_height)
+
+            network_height = sample.network.get('result')
+            logger.debug(f"Network block height: {network_height}")
+            if network_height is not None:
+                update_metric(solana_network_block_height, network_height)
+                update_metric(solana_slot_rate, block_height_rate.update(network_height, sample.network_time), labels={"series": "block_height"})
+
+            # Calculate and log block height difference, corrected for sampling skew
+            height_diff = _corrected_lag(sample, block_height_rate, "getBlockHeight")
+            if height_diff is not None:
                 update_metric(solana_block_height_diff, height_diff)
                 if abs(height_diff) > 100:
                     logger.warning(f"Large block height difference detected: {height_diff} blocks")
@@ -1,13 +1,32 @@
+import asyncio
+import json
+import os
 import aiohttp
 from loguru import logger
-from config import SOLANA_RPC_ENDPOINT, HEADERS
-from utils.func import update_metric
+from config import (
+    SOLANA_RPC_ENDPOINT, TX_WATCH_ADDRESSES, TX_CURSOR_FILE, TX_WATCH_CONCURRENCY, TX_MAX_PAGES,
+    TX_MAX_BACKLOG_SLOTS, RPC_MODE, RPC_CAPTURE_FILE
+)
+from utils.func import update_metric, increment_metric
+from utils.rpc import rpc_request
+from utils.cardinality import reserve_watch_list
 from metrics.metrics import (
     solana_tx_count, solana_tx_success_rate, solana_tx_error_rate,
     solana_rpc_processed_tx_count, solana_rpc_tx_by_type,
-    solana_rpc_tx_latency, solana_confirmed_transactions_total
+    solana_rpc_tx_latency, solana_confirmed_transactions_total,
+    solana_rpc_tx_signatures, solana_rpc_tx_signature_backlog,
+    solana_rpc_tx_signature_skipped
 )
 
+# Maximum page size of getSignaturesForAddress
+SIGNATURE_PAGE_SIZE = 1000
+
+TX_TYPES = ("success", "error", "memo")
+
+reserve_watch_list(solana_rpc_tx_signatures, len(TX_WATCH_ADDRESSES) * len(TX_TYPES))
+reserve_watch_list(solana_rpc_tx_signature_backlog, len(TX_WATCH_ADDRESSES))
+reserve_watch_list(solana_rpc_tx_signature_skipped, len(TX_WATCH_ADDRESSES))
+
 async def get_transaction_stats():
     """Get transaction statistics from the RPC node"""
     payload = {
@@ -19,8 +38,7 @@ async def get_transaction_stats():
 
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
 
         if "result" in result and result["result"]:
             samples = result["result"]
@@ -50,53 +68,185 @@ async def get_transaction_stats():
         update_metric(solana_rpc_tx_latency, 0, labels={"type": "total_tps"})
         update_metric(solana_rpc_tx_latency, 0, labels={"type": "non_vote_tps"})
 
-async def get_transaction_types():
-    """Get transaction type distribution from recent transactions"""
+# Replays start from the cursors the recording started with, and never
+# move the live cursors
+REPLAY_CURSOR_FILE = f"{RPC_CAPTURE_FILE}.tx_cursors.json"
+
+
+def _load_cursors(path):
+    """
+    Load the signature cursors per address.
+
+    A cursor holds `until`, the newest signature counted without gaps, and
+    its slot. While a backlog larger than TX_MAX_PAGES is drained it also
+    holds `head`, the newest signature of the backlog, and `before`, the
+    oldest one counted so far.
+    """
+    try:
+        with open(path, "r") as cursor_file:
+            cursors = json.load(cursor_file)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Error reading {path}: {e}, starting from the latest signatures")
+        return {}
+    # Cursor files written before backlogs were tracked hold bare signatures
+    return {
+        address: cursor if isinstance(cursor, dict) else {"until": cursor}
+        for address, cursor in cursors.items()
+    }
+
+
+def _save_cursors(path=TX_CURSOR_FILE):
+    """Persist cursors atomically so a restart resumes where we left off"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_file = f"{path}.tmp"
+    with open(temp_file, "w") as cursor_file:
+        json.dump(_cursors, cursor_file)
+    os.replace(temp_file, path)
+
+
+if RPC_MODE == "replay":
+    _cursors = _load_cursors(REPLAY_CURSOR_FILE)
+else:
+    _cursors = _load_cursors(TX_CURSOR_FILE)
+    if RPC_MODE == "record":
+        _save_cursors(REPLAY_CURSOR_FILE)
+
+
+async def _get_signatures(session, address, options):
     payload = {
         "jsonrpc": "2.0",
         "id": 1,
         "method": "getSignaturesForAddress",
-        "params": [
-            "11111111111111111111111111111111",  # System program
-            {"limit": 100}
-        ]
+        "params": [address, options]
     }
+    result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+    if "result" not in result:
+        raise RuntimeError(result.get("error", "unexpected response"))
+    return result["result"]
+
+
+def _count_signatures(tx_types, signatures):
+    for tx in signatures:
+        if tx.get("err"):
+            tx_types["error"] += 1
+        elif tx.get("memo"):
+            tx_types["memo"] += 1
+        else:
+            tx_types["success"] += 1
+
 
+async def _ingest_signatures(session, address, semaphore):
+    """
+    Count signatures of address newer than its cursor, at most TX_MAX_PAGES
+    pages per cycle.
+
+    Pages run from newest to oldest. When the page limit is hit the
+    position is kept and the backlog is drained in later cycles before
+    moving on to newer signatures, so every signature is counted once.
+    A backlog wider than TX_MAX_BACKLOG_SLOTS is given up: the cursor
+    moves to the head of the range and the skipped slots are counted in
+    solana_rpc_tx_signature_skipped_slots instead.
+
+    Returns:
+        Dictionary of transaction type -> count of new signatures
+    """
+    tx_types = dict.fromkeys(TX_TYPES, 0)
+    cursor = _cursors.get(address)
+
+    async with semaphore:
+        # Without a cursor we only learn the newest signature; counting
+        # starts with the next cycle
+        if cursor is None:
+            signatures = await _get_signatures(session, address, {"limit": 1})
+            if signatures:
+                _cursors[address] = {"until": signatures[0]["signature"], "until_slot": signatures[0]["slot"]}
+            return tx_types
+
+        pages = 0
+        caught_up = False
+        try:
+            while pages < TX_MAX_PAGES:
+                if "head" not in cursor:
+                    # A range that started at the newest signature this cycle is done
+                    if caught_up:
+                        break
+                    caught_up = True
+
+                options = {"limit": SIGNATURE_PAGE_SIZE, "until": cursor["until"]}
+                if "before" in cursor:
+                    options["before"] = cursor["before"]
+                signatures = await _get_signatures(session, address, options)
+                pages += 1
+                _count_signatures(tx_types, signatures)
+
+                if signatures:
+                    if "head" not in cursor:
+                        cursor["head"] = signatures[0]["signature"]
+                        cursor["head_slot"] = signatures[0]["slot"]
+                    cursor["before"] = signatures[-1]["signature"]
+                    cursor["before_slot"] = signatures[-1]["slot"]
+
+                if len(signatures) < SIGNATURE_PAGE_SIZE:
+                    # Everything up to the head of the range is counted
+                    if "head" in cursor:
+                        cursor = _cursors[address] = {"until": cursor["head"], "until_slot": cursor["head_slot"]}
+        finally:
+            for tx_type, count in tx_types.items():
+                increment_metric(solana_rpc_tx_signatures, count, labels={"address": address, "tx_type": tx_type})
+
+    backlog = 0
+    if "head" in cursor:
+        backlog = cursor["before_slot"] - cursor.get("until_slot", cursor["before_slot"])
+        if TX_MAX_BACKLOG_SLOTS and backlog > TX_MAX_BACKLOG_SLOTS:
+            logger.warning(f"Signature backlog for {address} exceeds {TX_MAX_BACKLOG_SLOTS} slots, skipping {backlog} slots")
+            increment_metric(solana_rpc_tx_signature_skipped, backlog, labels={"address": address})
+            cursor = _cursors[address] = {"until": cursor["head"], "until_slot": cursor["head_slot"]}
+            backlog = 0
+    update_metric(solana_rpc_tx_signature_backlog, backlog, labels={"address": address})
+    if "head" in cursor:
+        logger.warning(f"Signature backlog for {address} exceeds {TX_MAX_PAGES} pages, {backlog} slots left to count")
+    return tx_types
+
+
+async def get_transaction_types():
+    """Count new signatures by type for the watched addresses since the last cycle"""
     try:
+        semaphore = asyncio.Semaphore(TX_WATCH_CONCURRENCY)
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                result = await response.json()
-
-        if "result" in result and isinstance(result["result"], list):
-            tx_types = {
-                "success": 0,
-                "error": 0,
-                "memo": 0
-            }
+            results = await asyncio.gather(
+                *(_ingest_signatures(session, address, semaphore) for address in TX_WATCH_ADDRESSES),
+                return_exceptions=True
+            )
+
+        tx_types = {"success": 0, "error": 0, "memo": 0}
+        for address, result in zip(TX_WATCH_ADDRESSES, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting signatures for {address}: {result}")
+                continue
+            for tx_type, count in result.items():
+                tx_types[tx_type] += count
+
+        if RPC_MODE != "replay":
+            _save_cursors()
+
+        # Update metrics for each transaction type seen this cycle
+        for tx_type, count in tx_types.items():
+            update_metric(solana_rpc_tx_by_type, count, labels={"tx_type": tx_type})
+
+        # Calculate success/error rates
+        total_tx = sum(tx_types.values())
+        if total_tx > 0:
+            success_rate = (tx_types["success"] / total_tx) * 100
+            error_rate = (tx_types["error"] / total_tx) * 100
             
-            total_tx = len(result["result"])
+            update_metric(solana_tx_success_rate, success_rate)
+            update_metric(solana_tx_error_rate, error_rate)
             
-            for tx in result["result"]:
-                if tx.get("err"):
-                    tx_types["error"] += 1
-                elif tx.get("memo"):
-                    tx_types["memo"] += 1
-                else:
-                    tx_types["success"] += 1
-
-            # Update metrics for each transaction type
-            for tx_type, count in tx_types.items():
-                update_metric(solana_rpc_tx_by_type, count, labels={"tx_type": tx_type})
-
-            # Calculate success/error rates
-            if total_tx > 0:
-                success_rate = (tx_types["success"] / total_tx) * 100
-                error_rate = (tx_types["error"] / total_tx) * 100
-                
-                update_metric(solana_tx_success_rate, success_rate)
-                update_metric(solana_tx_error_rate, error_rate)
-                
-                logger.info(f"Transaction types - Distribution: {tx_types}, Success: {success_rate:.2f}%, Error: {error_rate:.2f}%")
+            logger.info(f"Transaction types - Distribution: {tx_types}, Success: {success_rate:.2f}%, Error: {error_rate:.2f}%")
 
     except Exception as e:
         logger.error(f"Error getting transaction types: {e}")
@@ -117,8 +267,7 @@ async def get_confirmed_transactions_total():
 
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
 
         if "result" in result:
             total_tx = result["result"]
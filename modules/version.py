@@ -1,7 +1,8 @@
 import aiohttp
 from loguru import logger
-from config import HEADERS, SOLANA_RPC_ENDPOINT, PORT
+from config import SOLANA_RPC_ENDPOINT, PORT
 from utils.func import update_metric
+from utils.rpc import rpc_request
 from metrics.metrics import solana_node_version
 
 PROMETHEUS_METRICS_URL = f"http://localhost:{PORT}/metrics"
@@ -12,8 +13,7 @@ async def get_version():
 
     try:
         async with aiohttp.ClientSession() as session:
-            async with session.post(SOLANA_RPC_ENDPOINT, json=payload, headers=HEADERS) as response:
-                result = await response.json()
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
 
         if "result" in result:
             current_version = result['result'].get('solana-core')
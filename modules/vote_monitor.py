@@ -0,0 +1,170 @@
+# modules/vote_monitor.py
+import aiohttp
+from typing import NamedTuple
+from loguru import logger
+from config import SOLANA_RPC_ENDPOINT, VOTE_ACCOUNTS_INTERVAL, VOTE_WATCH_LIST
+from utils.func import update_metric, remove_metric, diff_snapshots, percentiles, Cadence
+from utils.rpc import rpc_request, collection_clock
+from utils.cardinality import reserve_watch_list
+from metrics.metrics import (
+    solana_validator_activated_stake, solana_validator_commission,
+    solana_validator_delinquent, solana_validator_last_vote,
+    solana_validator_root_slot, solana_validator_vote_lag,
+    solana_validator_root_lag, solana_validator_epoch_credits,
+    solana_cluster_validators, solana_cluster_delinquent_stake_fraction,
+    solana_cluster_epoch_credits
+)
+
+CREDIT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+WATCHED_METRICS = (
+    solana_validator_activated_stake, solana_validator_commission,
+    solana_validator_delinquent, solana_validator_last_vote,
+    solana_validator_root_slot, solana_validator_vote_lag,
+    solana_validator_root_lag, solana_validator_epoch_credits
+)
+
+for metric in WATCHED_METRICS:
+    reserve_watch_list(metric, len(VOTE_WATCH_LIST))
+
+
+class VoteState(NamedTuple):
+    activated_stake: int
+    commission: int
+    last_vote: int
+    root_slot: int
+    credits_epoch: int
+    epoch_credits: int
+    delinquent: bool
+
+
+# Last getVoteAccounts snapshot keyed by vote pubkey, and the values last
+# exported for each watched vote account
+_index = {}
+_exported = {}
+_cadence = Cadence(VOTE_ACCOUNTS_INTERVAL, collection_clock)
+
+
+def _parse_vote_account(account, delinquent):
+    """Reduce a getVoteAccounts entry to the fields we track"""
+    credits_epoch, epoch_credits = 0, 0
+    epoch_history = account.get("epochCredits") or []
+    if epoch_history:
+        credits_epoch, credits, previous_credits = epoch_history[-1]
+        epoch_credits = credits - previous_credits
+
+    return VoteState(
+        activated_stake=account.get("activatedStake", 0),
+        commission=account.get("commission", 0),
+        last_vote=account.get("lastVote", 0),
+        root_slot=account.get("rootSlot") or 0,
+        credits_epoch=credits_epoch,
+        epoch_credits=epoch_credits,
+        delinquent=delinquent
+    )
+
+
+def _update_cluster_aggregates(snapshot):
+    """Recompute cluster-wide vote account aggregates"""
+    current_epoch = max((state.credits_epoch for state in snapshot.values()), default=0)
+    total_stake = 0
+    delinquent_stake = 0
+    delinquent_count = 0
+    credits = []
+
+    for state in snapshot.values():
+        total_stake += state.activated_stake
+        if state.delinquent:
+            delinquent_stake += state.activated_stake
+            delinquent_count += 1
+        if state.credits_epoch == current_epoch:
+            credits.append(state.epoch_credits)
+
+    update_metric(solana_cluster_validators, len(snapshot) - delinquent_count, labels={"state": "current"})
+    update_metric(solana_cluster_validators, delinquent_count, labels={"state": "delinquent"})
+    if total_stake > 0:
+        update_metric(solana_cluster_delinquent_stake_fraction, delinquent_stake / total_stake)
+
+    credits.sort()
+    for quantile, value in percentiles(credits, CREDIT_QUANTILES).items():
+        update_metric(solana_cluster_epoch_credits, value, labels={"quantile": str(quantile)})
+
+    logger.info(
+        f"Vote accounts - Total: {len(snapshot)}, Delinquent: {delinquent_count}, "
+        f"Delinquent stake: {delinquent_stake / total_stake if total_stake else 0:.2%}"
+    )
+
+
+def _update_watched(snapshot):
+    """Update per-validator series for the watch-list, writing only changed values"""
+    highest_vote = max((state.last_vote for state in snapshot.values()), default=0)
+    highest_root = max((state.root_slot for state in snapshot.values()), default=0)
+    current_epoch = max((state.credits_epoch for state in snapshot.values()), default=0)
+
+    for vote_pubkey in VOTE_WATCH_LIST:
+        state = snapshot.get(vote_pubkey)
+        if state is None:
+            if _exported.pop(vote_pubkey, None) is not None:
+                for metric in WATCHED_METRICS:
+                    remove_metric(metric, {"vote_pubkey": vote_pubkey})
+                logger.warning(f"Watched vote account {vote_pubkey} is no longer in getVoteAccounts")
+            continue
+
+        values = {
+            solana_validator_activated_stake: state.activated_stake,
+            solana_validator_commission: state.commission,
+            solana_validator_delinquent: int(state.delinquent),
+            solana_validator_last_vote: state.last_vote,
+            solana_validator_root_slot: state.root_slot,
+            solana_validator_vote_lag: highest_vote - state.last_vote,
+            solana_validator_root_lag: highest_root - state.root_slot,
+            solana_validator_epoch_credits: state.epoch_credits if state.credits_epoch == current_epoch else 0
+        }
+        previous = _exported.get(vote_pubkey, {})
+        for metric, value in values.items():
+            if previous.get(metric) != value:
+                update_metric(metric, value, labels={"vote_pubkey": vote_pubkey})
+        _exported[vote_pubkey] = values
+
+        if state.delinquent:
+            logger.warning(f"Watched vote account {vote_pubkey} is delinquent, vote lag: {highest_vote - state.last_vote}")
+
+
+async def get_vote_accounts():
+    """Collect vote account metrics at their own cadence, updating only changed series"""
+    global _index
+
+    if not _cadence.due():
+        return
+
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getVoteAccounts",
+        "params": [{"commitment": "finalized"}]
+    }
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            result = await rpc_request(session, SOLANA_RPC_ENDPOINT, payload)
+
+        if "result" not in result:
+            logger.error(f"Failed to get vote accounts: {result.get('error')}")
+            return
+
+        snapshot = {}
+        for group, delinquent in (("current", False), ("delinquent", True)):
+            for account in result["result"].get(group, []):
+                snapshot[account["votePubkey"]] = _parse_vote_account(account, delinquent)
+
+        changed, removed = diff_snapshots(_index, snapshot)
+        _index = snapshot
+        _cadence.mark()
+
+        logger.debug(f"Vote accounts diff - Changed: {len(changed)}, Removed: {len(removed)}")
+        if changed or removed:
+            _update_cluster_aggregates(snapshot)
+            _update_watched(snapshot)
+
+    except Exception as e:
+        logger.error(f"Error getting vote accounts: {e}")
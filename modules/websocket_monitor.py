@@ -2,12 +2,21 @@ import asyncio
 import json
 import websockets
 from loguru import logger
-from config import SOLANA_WS_ENDPOINT
+from config import SOLANA_WS_ENDPOINT, RPC_MODE
 from utils.func import update_metric
+from utils.readiness import record_signal
 from metrics.metrics import solana_rpc_websocket_connections, solana_rpc_websocket_latency
 
 async def check_websocket_health():
-    """Check WebSocket connection health by subscribing to slots"""
+    """
+    Check WebSocket connection health by subscribing to slots.
+
+    WebSocket traffic is not part of RPC captures, so the check is skipped
+    when replaying instead of reaching out to the live endpoint.
+    """
+    if RPC_MODE == "replay":
+        return
+
     subscription_payload = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -32,6 +41,7 @@ async def check_websocket_health():
                 end_time = asyncio.get_event_loop().time()
                 latency = (end_time - start_time) * 1000  # Convert to milliseconds
                 update_metric(solana_rpc_websocket_latency, latency)
+                record_signal("websocket", True)
                 logger.info(f"WebSocket connection healthy - Latency: {latency:.2f}ms")
 
                 # Unsubscribe
@@ -47,8 +57,10 @@ async def check_websocket_health():
             else:
                 logger.error(f"Failed to subscribe to slots: {response_data}")
                 update_metric(solana_rpc_websocket_connections, 0)
+                record_signal("websocket", False)
 
     except Exception as e:
         logger.error(f"WebSocket connection failed: {e}")
         update_metric(solana_rpc_websocket_connections, 0)
-        update_metric(solana_rpc_websocket_latency, 0)
\ No newline at end of file
+        update_metric(solana_rpc_websocket_latency, 0)
+        record_signal("websocket", False)
\ No newline at end of file
@@ -0,0 +1,103 @@
+from prometheus_client import CollectorRegistry, Counter, Gauge
+from metrics.metrics import summable, retained
+from utils.cardinality import CardinalityGuard, LABEL_EXPIRY_CYCLES, OTHER_LABEL
+
+
+def series(metric):
+    """Current samples of a metric keyed by their first label value"""
+    return {
+        next(iter(sample.labels.values())): sample.value
+        for sample in metric.collect()[0].samples
+        if sample.name in (metric._name, f"{metric._name}_total")
+    }
+
+
+def test_counter_label_sets_are_ranked_by_amount():
+    guard = CardinalityGuard(2)
+    metric = Counter("test_signatures", "Test", ["address"], registry=CollectorRegistry())
+
+    for _ in range(20):
+        guard.inc(metric, {"address": "a"}, 1)
+        guard.inc(metric, {"address": "b"}, 1)
+        guard.inc(metric, {"address": "busy"}, 10000)
+        guard.end_cycle()
+
+    values = series(metric)
+    assert values["busy"] == 200000
+    assert len(values) == 3
+    assert values[OTHER_LABEL] > 0
+
+
+def test_upgraded_version_gets_a_series_and_old_versions_expire():
+    guard = CardinalityGuard(5)
+    metric = Gauge("test_node_version", "Test", ["version"], registry=CollectorRegistry())
+
+    # Like modules/version.py: the running version is set to 1 every cycle
+    # and the previous one to 0 once, after which it is never written again
+    previous = None
+    for release in range(1, 8):
+        current = f"v{release}"
+        for cycle in range(3):
+            if previous is not None and cycle == 0:
+                guard.set(metric, {"version": previous}, 0)
+            guard.set(metric, {"version": current}, 1)
+            guard.end_cycle()
+            assert series(metric).get(current) == 1
+        previous = current
+
+    for _ in range(LABEL_EXPIRY_CYCLES):
+        guard.set(metric, {"version": previous}, 1)
+        guard.end_cycle()
+    assert series(metric) == {previous: 1}
+
+
+def test_non_summable_gauge_overflow_is_dropped():
+    guard = CardinalityGuard(2)
+    metric = Gauge("test_latency", "Test", ["method"], registry=CollectorRegistry())
+
+    for method in ("a", "b", "c"):
+        guard.set(metric, {"method": method}, 0.5)
+    guard.end_cycle()
+
+    assert series(metric) == {"a": 0.5, "b": 0.5}
+
+
+def test_summable_gauge_overflow_is_summed_into_other():
+    guard = CardinalityGuard(1)
+    metric = summable(Gauge("test_balance", "Test", ["account"], registry=CollectorRegistry()))
+
+    guard.set(metric, {"account": "a"}, 10)
+    guard.set(metric, {"account": "b"}, 3)
+    guard.set(metric, {"account": "c"}, 4)
+
+    assert series(metric) == {"a": 10, OTHER_LABEL: 7}
+
+
+def test_retained_gauge_keeps_large_label_sets_written_only_on_change():
+    guard = CardinalityGuard(1)
+    metric = retained(summable(Gauge("test_versions", "Test", ["version"], registry=CollectorRegistry())))
+
+    # Like the gossip collector: a stable version is written once, a small
+    # churny one on every change
+    guard.set(metric, {"version": "stable"}, 3000)
+    for cycle in range(LABEL_EXPIRY_CYCLES * 2):
+        guard.set(metric, {"version": "dev"}, 5 + cycle % 2)
+        guard.end_cycle()
+
+    values = series(metric)
+    assert values["stable"] == 3000
+    assert "dev" not in values
+
+
+def test_reserved_watch_list_gets_a_series_per_entry_unless_budgeted():
+    guard = CardinalityGuard(1, {"test_budgeted": 1})
+    watched = Gauge("test_watched", "Test", ["address"], registry=CollectorRegistry())
+    budgeted = Gauge("test_budgeted", "Test", ["address"], registry=CollectorRegistry())
+
+    for metric in (watched, budgeted):
+        guard.reserve(metric, 3)
+        for address in ("a", "b", "c"):
+            guard.set(metric, {"address": address}, 1)
+
+    assert len(series(watched)) == 3
+    assert len(series(budgeted)) == 1
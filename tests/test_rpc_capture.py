@@ -0,0 +1,90 @@
+import asyncio
+import os
+import utils.rpc as rpc
+from config import SOLANA_RPC_ENDPOINT
+from metrics.metrics import solana_rpc_latency
+from utils.rpc import RpcRecorder, RpcReplayer
+
+ENDPOINT = "http://localhost:8899"
+
+
+def request(method, params=None):
+    return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
+
+
+def response(result):
+    return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+def replay(replayer, payload):
+    return asyncio.run(replayer.replay(ENDPOINT, payload))
+
+
+def test_capture_round_trip(tmp_path):
+    path = str(tmp_path / "capture.gz")
+    recorder = RpcRecorder(path)
+    recorder.record(ENDPOINT, request("getSlot"), response(100), recorder.started + 1, recorder.started + 1.5)
+    recorder.record(ENDPOINT, request("getSlot"), response(101), recorder.started + 2, recorder.started + 2.5)
+    recorder.record(ENDPOINT, request("getBalance", ["addr"]), response({"value": 5}), recorder.started + 2, recorder.started + 3)
+    recorder.close()
+
+    replayer = RpcReplayer(path, 0)
+    assert replayer.remaining == 3
+
+    # Responses to identical requests come back in recorded order, ids ignored
+    assert replay(replayer, dict(request("getSlot"), id=7)) == response(100)
+    assert replay(replayer, request("getBalance", ["addr"])) == response({"value": 5})
+    assert replay(replayer, request("getSlot")) == response(101)
+    assert replayer.clock == 3
+    assert replayer.finished
+
+    assert "error" in replay(replayer, request("getSlot"))
+    assert "error" in replay(replayer, request("getEpochInfo"))
+
+
+def test_truncated_capture_replays_complete_records(tmp_path):
+    path = str(tmp_path / "capture.gz")
+    recorder = RpcRecorder(path)
+    for slot in range(3):
+        recorder.record(ENDPOINT, request("getSlot"), response(slot), recorder.started, recorder.started)
+    recorder.file.flush()
+    complete = os.path.getsize(path)
+    recorder.record(ENDPOINT, request("getBlock"), response(os.urandom(4096).hex()), recorder.started, recorder.started)
+    recorder.file.flush()
+    partial = os.path.getsize(path)
+
+    # Like an exporter killed while writing: no gzip trailer, last record cut off
+    with open(path, "rb") as capture:
+        data = capture.read()
+    recorder.close()
+    for size in (complete, (complete + partial) // 2):
+        truncated = str(tmp_path / f"truncated-{size}.gz")
+        with open(truncated, "wb") as capture:
+            capture.write(data[:size])
+
+        replayer = RpcReplayer(truncated, 0)
+        assert replayer.remaining == 3
+        assert [replay(replayer, request("getSlot"))["result"] for _ in range(3)] == [0, 1, 2]
+
+
+def test_request_metrics_use_the_method_sent(tmp_path, monkeypatch):
+    path = str(tmp_path / "capture.gz")
+    recorder = RpcRecorder(path)
+    info = {"absoluteSlot": 100, "blockHeight": 90}
+    recorder.record(SOLANA_RPC_ENDPOINT, request("getEpochInfo"), response(info), recorder.started, recorder.started + 0.25)
+    recorder.close()
+    monkeypatch.setattr(rpc, "_replayer", RpcReplayer(path, 0))
+    rpc.reset_rpc_cache()
+
+    async def collect():
+        slot = await rpc.rpc_request(None, SOLANA_RPC_ENDPOINT, request("getSlot"))
+        height = await rpc.rpc_request(None, SOLANA_RPC_ENDPOINT, request("getBlockHeight"))
+        return slot["result"], height["result"]
+
+    assert asyncio.run(collect()) == (100, 90)
+    methods = {
+        sample.labels["method"]: sample.value
+        for sample in solana_rpc_latency.collect()[0].samples
+    }
+    assert "getEpochInfo" in methods
+    assert "getSlot" not in methods and "getBlockHeight" not in methods
@@ -0,0 +1,91 @@
+import asyncio
+import pytest
+import modules.tx_monitor as tx_monitor
+from metrics.metrics import solana_rpc_tx_signature_backlog, solana_rpc_tx_signature_skipped
+
+
+class FakeLedger:
+    """Signatures of one address, newest first, one per slot"""
+
+    def __init__(self):
+        self.signatures = []
+        self.slot = 0
+        self.add(1)
+
+    def add(self, count, error_every=0):
+        for _ in range(count):
+            self.slot += 1
+            err = {"InstructionError": []} if error_every and self.slot % error_every == 0 else None
+            self.signatures.insert(0, {"signature": f"sig{self.slot}", "slot": self.slot, "err": err, "memo": None})
+
+    async def get_signatures(self, session, address, options):
+        index = {tx["signature"]: i for i, tx in enumerate(self.signatures)}
+        start = index[options["before"]] + 1 if "before" in options else 0
+        end = index[options["until"]] if "until" in options else len(self.signatures)
+        return self.signatures[start:end][:options["limit"]]
+
+
+@pytest.fixture
+def ledger(monkeypatch):
+    ledger = FakeLedger()
+    monkeypatch.setattr(tx_monitor, "_cursors", {})
+    monkeypatch.setattr(tx_monitor, "_get_signatures", ledger.get_signatures)
+    monkeypatch.setattr(tx_monitor, "SIGNATURE_PAGE_SIZE", 10)
+    monkeypatch.setattr(tx_monitor, "TX_MAX_PAGES", 2)
+    monkeypatch.setattr(tx_monitor, "TX_MAX_BACKLOG_SLOTS", 0)
+    return ledger
+
+
+def ingest(address):
+    async def run():
+        return await tx_monitor._ingest_signatures(None, address, asyncio.Semaphore(1))
+    return asyncio.run(run())
+
+
+def sample(metric, address):
+    for metric_family in metric.collect():
+        for item in metric_family.samples:
+            if item.labels.get("address") == address and not item.name.endswith("_created"):
+                return item.value
+    return None
+
+
+def test_backlog_is_counted_exactly_once(ledger):
+    address = "exact"
+    assert ingest(address) == {"success": 0, "error": 0, "memo": 0}
+
+    ledger.add(55, error_every=5)
+    totals = dict.fromkeys(tx_monitor.TX_TYPES, 0)
+    cycles = 0
+    while True:
+        counts = ingest(address)
+        cycles += 1
+        for tx_type, count in counts.items():
+            totals[tx_type] += count
+        if cycles == 1:
+            assert sample(solana_rpc_tx_signature_backlog, address) > 0
+            # New signatures arriving while the backlog drains are counted too
+            ledger.add(7, error_every=5)
+        if "head" not in tx_monitor._cursors[address] and not any(counts.values()):
+            break
+
+    assert totals == {"success": 50, "error": 12, "memo": 0}
+    assert tx_monitor._cursors[address]["until"] == ledger.signatures[0]["signature"]
+    assert sample(solana_rpc_tx_signature_backlog, address) == 0
+
+
+def test_backlog_beyond_maximum_is_skipped(ledger, monkeypatch):
+    monkeypatch.setattr(tx_monitor, "TX_MAX_BACKLOG_SLOTS", 20)
+    address = "skipped"
+    ingest(address)
+
+    ledger.add(55)
+    assert sum(ingest(address).values()) == 20
+    # The backlog ran from the old cursor at slot 1 to the oldest signature
+    # counted at slot 37
+    assert sample(solana_rpc_tx_signature_skipped, address) == 36
+    assert sample(solana_rpc_tx_signature_backlog, address) == 0
+    assert tx_monitor._cursors[address] == {"until": "sig56", "until_slot": 56}
+
+    ledger.add(3)
+    assert sum(ingest(address).values()) == 3
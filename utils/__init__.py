@@ -1,3 +1,3 @@
-from .func import update_metric
+from .func import update_metric, increment_metric, remove_metric, diff_snapshots, percentiles, Cadence
 
-__all__ = ['update_metric']
\ No newline at end of file
+__all__ = ['update_metric', 'increment_metric', 'remove_metric', 'diff_snapshots', 'percentiles', 'Cadence']
@@ -0,0 +1,349 @@
+# utils/cardinality.py
+from itertools import chain
+from loguru import logger
+from config import LABEL_BUDGET_DEFAULT, LABEL_BUDGETS
+from metrics.metrics import (
+    solana_exporter_label_sets, solana_exporter_overflow_label_sets,
+    solana_exporter_dropped_label_sets
+)
+
+OTHER_LABEL = "other"
+
+# Heavy-hitter table size relative to the label budget of a metric
+TRACKER_FACTOR = 4
+
+# Share of its weight a label set keeps from one collection cycle to the
+# next, so rankings follow recent traffic
+RANK_DECAY = 0.9
+
+# Collection cycles after which a label set that is no longer written
+# loses its series (gauges not marked retained)
+LABEL_EXPIRY_CYCLES = 20
+
+
+class SpaceSaving:
+    """
+    Weighted top-K heavy hitter tracking with the Space-Saving algorithm.
+
+    Keeps at most `capacity` counters. A new key replaces the smallest
+    counter and inherits its count as overestimation error, so
+    count - error is a guaranteed lower bound of the true total weight.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counters = {}
+
+    def offer(self, key, weight=1):
+        """
+        Add weight to the count of key.
+
+        Returns:
+            The key evicted from the table to make room, or None
+        """
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+            return None
+
+        if len(self.counters) < self.capacity:
+            self.counters[key] = [weight, 0]
+            return None
+
+        victim = min(self.counters, key=lambda k: self.counters[k][0])
+        victim_count = self.counters.pop(victim)[0]
+        self.counters[key] = [victim_count + weight, victim_count]
+        return victim
+
+    def decay(self, factor):
+        """Scale all counts and errors by factor so older weight fades out"""
+        for counter in self.counters.values():
+            counter[0] *= factor
+            counter[1] *= factor
+
+    def count(self, key):
+        """Estimated (upper bound) weight of key"""
+        counter = self.counters.get(key)
+        return counter[0] if counter else 0
+
+    def guaranteed(self, key):
+        """Guaranteed (lower bound) weight of key"""
+        counter = self.counters.get(key)
+        return counter[0] - counter[1] if counter else 0
+
+
+class LabelBudget:
+    """
+    Label-set budget of a single metric.
+
+    Label sets are ranked by recent weight: every collection cycle the
+    weights decay by RANK_DECAY. Counter label sets gain the amounts added
+    to them. Gauge label sets gain their current value (summable gauges)
+    or 1 (other gauges) in every cycle they are written; label sets of
+    gauges marked retained gain it in every cycle they are known, since
+    their collectors only write changes.
+
+    Label sets of gauges that are not retained expire after
+    LABEL_EXPIRY_CYCLES cycles without a write.
+    """
+
+    def __init__(self, metric, budget):
+        self.metric = metric
+        self.name = metric._name
+        self.budget = budget
+        self.counter = metric._type == "counter"
+        # Overflow of gauges not marked summable (latencies, percentiles,
+        # slots) is dropped, since a sum of those means nothing
+        self.summed = self.counter or getattr(metric, "_summable", False)
+        self.retained = getattr(metric, "_retained", False)
+        self.other = tuple(OTHER_LABEL for _ in metric._labelnames)
+        self.tracker = SpaceSaving(max(1, budget) * TRACKER_FACTOR)
+        # Label sets with their own series and their last value
+        self.admitted = {}
+        # Label sets without their own series and their last value
+        self.overflow = {}
+        # Cycle in which each gauge label set was last written
+        self.cycle = 0
+        self.written = {}
+
+    def route_increment(self, key, amount):
+        """
+        Rank a counter increment of key and decide where it goes.
+
+        Returns:
+            True if key has (or was given) its own series, False if the
+            increment goes to the other series
+        """
+        evicted = self.tracker.offer(key, amount)
+        # Counters keep no value, so forget overflow the table no longer tracks
+        if evicted in self.overflow:
+            del self.overflow[evicted]
+            self._report()
+
+        if key in self.admitted:
+            return True
+        if len(self.admitted) < self.budget or self._displace_weakest(key):
+            self._admit(key, None)
+            return True
+
+        if key not in self.overflow:
+            self.overflow[key] = None
+            self._report()
+        solana_exporter_dropped_label_sets.labels(metric=self.name).inc()
+        return False
+
+    def route_value(self, key, value):
+        """
+        Store a gauge value of key and decide where it goes.
+
+        Returns:
+            True if key has its own series, False if the value must be
+            folded into the other series (summed gauges) or dropped
+        """
+        self.written[key] = self.cycle
+        if key in self.admitted:
+            self.admitted[key] = value
+            return True
+        if len(self.admitted) < self.budget:
+            self._admit(key, value)
+            return True
+
+        # Budget exhausted: the label set waits in overflow until the
+        # end-of-cycle ranking finds it heavier than an admitted one
+        new = key not in self.overflow
+        self.overflow[key] = value
+        if new:
+            self._report()
+        solana_exporter_dropped_label_sets.labels(metric=self.name).inc()
+        return False
+
+    def end_cycle(self):
+        """Decay the ranking, rank this cycle's gauge writes, expire stale label sets and promote overflow"""
+        self.tracker.decay(RANK_DECAY)
+        if self.counter:
+            return
+
+        for key, value in chain(self.admitted.items(), self.overflow.items()):
+            if not self.retained and self.written.get(key) != self.cycle:
+                continue
+            weight = abs(value) if self.summed else 1
+            if weight:
+                self.tracker.offer(key, weight)
+
+        changed = False if self.retained else self._expire()
+
+        # Every swap raises the total weight of the admitted label sets, so this ends
+        while self.overflow:
+            candidate = max(self.overflow, key=self.tracker.guaranteed)
+            if len(self.admitted) >= self.budget and not self._displace_weakest(candidate):
+                break
+            value = self.overflow[candidate]
+            self._admit(candidate, value)
+            self.metric.labels(*candidate).set(value)
+            changed = True
+
+        if changed:
+            self.refresh_other()
+        self.cycle += 1
+
+    def _expire(self):
+        """
+        Forget label sets not written for LABEL_EXPIRY_CYCLES cycles.
+
+        Returns:
+            True if any label set expired
+        """
+        stale = [
+            key for key in chain(self.admitted, self.overflow)
+            if self.cycle - self.written.get(key, self.cycle) >= LABEL_EXPIRY_CYCLES
+        ]
+        for key in stale:
+            if key in self.admitted:
+                del self.admitted[key]
+                self.metric.remove(*key)
+            else:
+                del self.overflow[key]
+            del self.written[key]
+        if stale:
+            logger.debug(f"Expired {len(stale)} label sets of {self.name} not written for {LABEL_EXPIRY_CYCLES} cycles")
+            self._report()
+        return bool(stale)
+
+    def release(self, key):
+        """
+        Forget key.
+
+        Returns:
+            True if key had its own series that must be removed
+        """
+        self.written.pop(key, None)
+        if key in self.admitted:
+            del self.admitted[key]
+            self._report()
+            return True
+        if key in self.overflow:
+            del self.overflow[key]
+            self._report()
+            self.refresh_other()
+        return False
+
+    def refresh_other(self):
+        """Rewrite the other series of a summed gauge from the overflow values"""
+        if not self.summed or self.counter:
+            return
+        if self.overflow:
+            self.metric.labels(*self.other).set(sum(self.overflow.values()))
+        else:
+            try:
+                self.metric.remove(*self.other)
+            except KeyError:
+                pass
+
+    def _displace_weakest(self, key):
+        """
+        Move the weakest admitted label set to overflow if key provably
+        outweighs it.
+
+        Returns:
+            True if a slot was freed for key
+        """
+        if not self.admitted:
+            return False
+        weakest = min(self.admitted, key=self.tracker.count)
+        if self.tracker.guaranteed(key) <= self.tracker.count(weakest):
+            return False
+
+        self.overflow[weakest] = self.admitted.pop(weakest)
+        self.metric.remove(*weakest)
+        logger.debug(f"Label set {weakest} of {self.name} lost its series to {key}")
+        return True
+
+    def _admit(self, key, value):
+        self.overflow.pop(key, None)
+        self.admitted[key] = value
+        self._report()
+
+    def _report(self):
+        solana_exporter_label_sets.labels(metric=self.name).set(len(self.admitted))
+        solana_exporter_overflow_label_sets.labels(metric=self.name).set(len(self.overflow))
+
+
+class CardinalityGuard:
+    """Per-metric label-set budgets for metrics with dynamic labels"""
+
+    def __init__(self, default_budget, budgets=None):
+        self.default_budget = default_budget
+        self.budgets = budgets or {}
+        self._metrics = {}
+
+    def _budget_for(self, metric):
+        budget = self._metrics.get(metric)
+        if budget is None:
+            limit = self.budgets.get(metric._name, self.default_budget)
+            budget = self._metrics[metric] = LabelBudget(metric, limit)
+        return budget
+
+    def reserve(self, metric, label_sets):
+        """
+        Raise the budget of a metric whose label values come from an
+        operator-configured watch-list rather than from node responses.
+        An explicit label_budgets entry still takes precedence.
+        """
+        if metric._name in self.budgets:
+            return
+        budget = self._budget_for(metric)
+        if label_sets > budget.budget:
+            budget.budget = label_sets
+            budget.tracker.capacity = max(budget.tracker.capacity, label_sets * TRACKER_FACTOR)
+
+    @staticmethod
+    def _key(metric, labels):
+        return tuple(str(labels[name]) for name in metric._labelnames)
+
+    def set(self, metric, labels, value):
+        """Set a labelled gauge, folding or dropping label sets beyond the budget"""
+        budget = self._budget_for(metric)
+        key = self._key(metric, labels)
+        if budget.route_value(key, value):
+            metric.labels(*key).set(value)
+        else:
+            budget.refresh_other()
+
+    def inc(self, metric, labels, amount=1):
+        """Increment a labelled counter, folding label sets beyond the budget into the other series"""
+        budget = self._budget_for(metric)
+        key = self._key(metric, labels)
+        if budget.route_increment(key, amount):
+            metric.labels(*key).inc(amount)
+        else:
+            metric.labels(*budget.other).inc(amount)
+
+    def remove(self, metric, labels):
+        """Remove a labelled series and free its slot in the budget"""
+        key = self._key(metric, labels)
+        if self._budget_for(metric).release(key):
+            metric.remove(*key)
+
+    def end_cycle(self):
+        """Re-rank label sets once the collectors of a cycle have written"""
+        for budget in self._metrics.values():
+            budget.end_cycle()
+
+
+cardinality_guard = CardinalityGuard(LABEL_BUDGET_DEFAULT, LABEL_BUDGETS)
+
+
+def reserve_watch_list(metric, label_sets):
+    """
+    Give every label set of an operator-configured watch-list its own series.
+
+    Watch-list labels (addresses, vote pubkeys, account sets) are chosen by
+    the operator rather than by node responses, so they are not ranked
+    against each other: the budget of metric is raised to label_sets
+    unless label_budgets names it explicitly.
+
+    Args:
+        metric: Labelled metric written for watch-list entries
+        label_sets: Number of label sets the watch-list produces
+    """
+    cardinality_guard.reserve(metric, label_sets)
@@ -1,6 +1,14 @@
+import math
+import time
+from utils.cardinality import cardinality_guard
+
+
 def update_metric(metric, value, labels=None):
     """
     Update Prometheus metric with optional labels.
+
+    Labelled updates go through the cardinality guard, so label sets beyond
+    the metric's budget are folded into an 'other' series.
     
     Args:
         metric: Prometheus metric object
@@ -9,6 +17,92 @@ def update_metric(metric, value, labels=None):
     """
     if value is not None:
         if labels:
-            metric.labels(**labels).set(value)
+            cardinality_guard.set(metric, labels, value)
         else:
             metric.set(value)
+
+
+def increment_metric(metric, amount=1, labels=None):
+    """
+    Increment Prometheus counter with optional labels.
+
+    Args:
+        metric: Prometheus counter object
+        amount: Amount to add
+        labels: Optional dictionary of label key-value pairs
+    """
+    if amount:
+        if labels:
+            cardinality_guard.inc(metric, labels, amount)
+        else:
+            metric.inc(amount)
+
+
+def remove_metric(metric, labels):
+    """
+    Remove a labelled series and release its label budget.
+
+    Args:
+        metric: Prometheus metric object
+        labels: Dictionary of label key-value pairs
+    """
+    cardinality_guard.remove(metric, labels)
+
+
+def diff_snapshots(previous, current):
+    """
+    Compare two keyed snapshots.
+
+    Args:
+        previous: Dictionary of key -> state from the last fetch
+        current: Dictionary of key -> state from this fetch
+
+    Returns:
+        Tuple of (changed, removed) key lists; changed includes new keys
+    """
+    changed = [key for key, state in current.items() if previous.get(key) != state]
+    removed = [key for key in previous if key not in current]
+    return changed, removed
+
+
+def percentiles(sorted_values, quantiles):
+    """
+    Nearest-rank percentiles of an already sorted sequence.
+
+    Args:
+        sorted_values: Sequence of values in ascending order
+        quantiles: Iterable of quantiles between 0 and 1
+
+    Returns:
+        Dictionary of quantile -> value, empty if there are no values
+    """
+    count = len(sorted_values)
+    if not count:
+        return {}
+    return {
+        quantile: sorted_values[min(count - 1, max(0, math.ceil(quantile * count) - 1))]
+        for quantile in quantiles
+    }
+
+
+class Cadence:
+    """
+    Track when a collector running slower than the main loop is due.
+
+    Args:
+        interval: Seconds between runs
+        clock: Function returning the current time in seconds
+    """
+
+    def __init__(self, interval, clock=time.monotonic):
+        self.interval = interval
+        self.clock = clock
+        self._last_run = None
+
+    def due(self):
+        """Return True if the interval has elapsed since the last successful run"""
+        return self._last_run is None or self.clock() - self._last_run >= self.interval
+
+    def mark(self):
+        """Record a successful run"""
+        self._last_run = self.clock()
@@ -0,0 +1,123 @@
+# utils/readiness.py
+import json
+import time
+from loguru import logger
+from config import (
+    SLEEP_TIME, RPC_MODE, READY_NODE_NAME, READY_MAX_SLOT_LAG, READY_MAX_BLOCK_TIME_LAG,
+    READY_REQUIRE_WEBSOCKET, READY_RISE, READY_FALL
+)
+from metrics.metrics import solana_node_ready
+
+# A node whose state is older than this many collection intervals is not ready
+STALE_CYCLES = 3
+
+
+class NodeReadiness:
+    """Readiness of one node with hysteresis, evaluated once per collection cycle"""
+
+    def __init__(self, name):
+        self.name = name
+        self.signals = {}
+        self.ready = False
+        self.streak = 0
+        self.evaluated_at = None
+        self.reasons = ["not evaluated yet"]
+        self.body = b""
+        self._render()
+
+    def record(self, signal, value):
+        self.signals[signal] = value
+
+    def evaluate(self):
+        """Apply the readiness rules to the signals collected this cycle"""
+        reasons = []
+        if self.signals.get("healthy") is not True:
+            reasons.append("node unhealthy")
+
+        slot_lag = self.signals.get("slot_lag")
+        if slot_lag is not None and slot_lag > READY_MAX_SLOT_LAG:
+            reasons.append(f"slot lag {slot_lag} > {READY_MAX_SLOT_LAG}")
+
+        block_time_lag = self.signals.get("block_time_lag")
+        if block_time_lag is not None and block_time_lag > READY_MAX_BLOCK_TIME_LAG:
+            reasons.append(f"block time lag {block_time_lag}s > {READY_MAX_BLOCK_TIME_LAG}s")
+
+        # WebSocket health is not replayed
+        if READY_REQUIRE_WEBSOCKET and RPC_MODE != "replay" and self.signals.get("websocket") is not True:
+            reasons.append("websocket down")
+
+        # Flip only after READY_RISE passing or READY_FALL failing cycles in a row
+        passing = not reasons
+        if passing == self.ready:
+            self.streak = 0
+        else:
+            self.streak += 1
+            if self.streak >= (READY_RISE if passing else READY_FALL):
+                self.ready = passing
+                self.streak = 0
+                logger.info(f"Node {self.name} is now {'ready' if passing else 'not ready'}: {', '.join(reasons) or 'all checks passed'}")
+
+        self.reasons = reasons
+        self.evaluated_at = time.monotonic()
+        self.signals = {}
+        solana_node_ready.labels(node=self.name).set(int(self.ready))
+        self._render()
+
+    def _render(self):
+        self.body = json.dumps({"node": self.name, "ready": self.ready, "reasons": self.reasons}).encode()
+
+    def is_ready(self, now):
+        return self.ready and self.evaluated_at is not None and now - self.evaluated_at <= STALE_CYCLES * SLEEP_TIME
+
+
+_nodes = {READY_NODE_NAME: NodeReadiness(READY_NODE_NAME)}
+
+READY_BODY = b'{"ready": true}'
+NOT_READY_BODY = b'{"ready": false}'
+STALE_BODY = b'{"ready": false, "reasons": ["state is stale"]}'
+UNKNOWN_BODY = b'{"ready": false, "reasons": ["unknown node"]}'
+
+
+def record_signal(signal, value, node=READY_NODE_NAME):
+    """
+    Record a readiness input collected during the current cycle.
+
+    Args:
+        signal: One of healthy, slot_lag, block_time_lag, websocket
+        value: Observed value
+        node: Node the signal belongs to
+    """
+    _nodes[node].record(signal, value)
+
+
+def evaluate_readiness():
+    """Apply the readiness rules to every node once the inputs of a cycle are in"""
+    for node in _nodes.values():
+        node.evaluate()
+
+
+def _node_response(state, now):
+    if state.is_ready(now):
+        return 200, state.body
+    # Ready but not refreshed for a while means the collector is stuck
+    return 503, STALE_BODY if state.ready else state.body
+
+
+def readiness_response(node=None):
+    """
+    Return the (status, body) served for a readiness probe without doing any I/O.
+
+    Args:
+        node: Node name, or None for all nodes
+    """
+    now = time.monotonic()
+    if node is None:
+        if len(_nodes) == 1:
+            return _node_response(next(iter(_nodes.values())), now)
+        ready = all(state.is_ready(now) for state in _nodes.values())
+        return (200, READY_BODY) if ready else (503, NOT_READY_BODY)
+
+    state = _nodes.get(node)
+    if state is None:
+        return 404, UNKNOWN_BODY
+    return _node_response(state, now)
@@ -0,0 +1,295 @@
+# utils/rpc.py
+import asyncio
+import atexit
+import gzip
+import json
+import os
+import struct
+import time
+from collections import defaultdict, deque
+from loguru import logger
+from config import (
+    HEADERS, SOLANA_RPC_ENDPOINT, RPC_MODE, RPC_CAPTURE_FILE, RPC_REPLAY_SPEED,
+    RPC_CACHE_TTL
+)
+from utils.func import update_metric
+from metrics.metrics import solana_rpc_requests, solana_rpc_errors, solana_rpc_latency
+
+# Capture file: gzip stream of records, each a 4-byte big-endian length
+# followed by a compact JSON object:
+#   t: seconds since recording started when the request was sent
+#   d: seconds until the response was received
+#   e: endpoint, q: request payload, r: response payload
+RECORD_HEADER = struct.Struct(">I")
+
+# Flush the capture at most this often so a killed exporter loses little
+RECORD_FLUSH_INTERVAL = 1.0
+
+
+def request_key(endpoint, payload):
+    """Identify a request by endpoint, method and params, ignoring ids"""
+    if isinstance(payload, list):
+        requests = [(item.get("method"), item.get("params")) for item in payload]
+    else:
+        requests = (payload.get("method"), payload.get("params"))
+    return json.dumps([endpoint, requests], sort_keys=True, separators=(",", ":"))
+
+
+class RpcRecorder:
+    """Write request/response pairs with timing to a capture file"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = gzip.open(path, "wb")
+        self.started = time.monotonic()
+        self.last_flush = self.started
+        self.records = 0
+        atexit.register(self.close)
+        logger.info(f"Recording RPC traffic to {path}")
+
+    def record(self, endpoint, payload, response, sent, received):
+        data = json.dumps(
+            {"t": sent - self.started, "d": received - sent, "e": endpoint, "q": payload, "r": response},
+            separators=(",", ":")
+        ).encode()
+        self.file.write(RECORD_HEADER.pack(len(data)))
+        self.file.write(data)
+        self.records += 1
+
+        if received - self.last_flush >= RECORD_FLUSH_INTERVAL:
+            self.file.flush()
+            self.last_flush = received
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+            logger.info(f"Recorded {self.records} RPC responses")
+
+
+class RpcReplayer:
+    """Serve responses from a capture file at real or accelerated speed"""
+
+    def __init__(self, path, speed):
+        self.speed = speed
+        self.started = None
+        # Capture time reached by the replay: the latest recorded arrival
+        # served plus the waits between collections
+        self.clock = 0.0
+        self.remaining = 0
+        self.exhausted = False
+        self.responses = defaultdict(deque)
+
+        with gzip.open(path, "rb") as capture:
+            try:
+                while header := capture.read(RECORD_HEADER.size):
+                    if len(header) < RECORD_HEADER.size:
+                        raise EOFError("capture ends inside a record header")
+                    (length,) = RECORD_HEADER.unpack(header)
+                    data = capture.read(length)
+                    if len(data) < length:
+                        raise EOFError("capture ends inside a record")
+                    record = json.loads(data)
+                    self.responses[request_key(record["e"], record["q"])].append(record)
+                    self.remaining += 1
+            except EOFError as e:
+                # A recorder killed without closing the capture leaves a
+                # truncated stream, replay what was completely written
+                logger.warning(f"Capture {path} is truncated ({e}), stopping at record {self.remaining}")
+
+        logger.info(f"Replaying {self.remaining} RPC responses from {path} at {speed}x")
+
+    @property
+    def finished(self):
+        return self.remaining == 0 or self.exhausted
+
+    async def replay(self, endpoint, payload):
+        now = time.monotonic()
+        if self.started is None:
+            self.started = now
+
+        queue = self.responses.get(request_key(endpoint, payload))
+        if not queue:
+            # A request that was recorded but has no responses left means
+            # the capture has run out
+            self.exhausted = self.exhausted or queue is not None
+            error = {"code": -32000, "message": "No recorded response"}
+            if isinstance(payload, list):
+                return [{"jsonrpc": "2.0", "id": item.get("id"), "error": error} for item in payload]
+            return {"jsonrpc": "2.0", "id": payload.get("id"), "error": error}
+
+        record = queue.popleft()
+        self.remaining -= 1
+        self.clock = max(self.clock, record["t"] + record["d"])
+        if self.speed > 0:
+            # Hold the response until it arrived in the recording
+            delay = self.started + (record["t"] + record["d"]) / self.speed - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return record["r"]
+
+
+class RpcCache:
+    """
+    Memo of RPC responses for one collection cycle.
+
+    Identical requests share a single in-flight fetch; the stored value is
+    the (response, sent, received) tuple of that fetch.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.entries = {}
+
+    def clear(self):
+        self.entries.clear()
+
+    async def get(self, key, fetch):
+        now = time.monotonic()
+        entry = self.entries.get(key)
+        if entry is None or (self.ttl > 0 and now - entry[0] >= self.ttl):
+            entry = (now, asyncio.ensure_future(fetch()))
+            self.entries[key] = entry
+            entry[1].add_done_callback(lambda future: self._discard_failed(key, entry, future))
+        # Shield the shared fetch so one cancelled caller does not cancel it for all
+        return await asyncio.shield(entry[1])
+
+    def _discard_failed(self, key, entry, future):
+        if (future.cancelled() or future.exception() is not None) and self.entries.get(key) is entry:
+            del self.entries[key]
+
+
+# Requests answered from a richer response with the same params:
+# method -> (source method, projection of the source result)
+DERIVED_METHODS = {
+    "getSlot": ("getEpochInfo", lambda info: info["absoluteSlot"]),
+    "getBlockHeight": ("getEpochInfo", lambda info: info["blockHeight"]),
+}
+
+_recorder = RpcRecorder(RPC_CAPTURE_FILE) if RPC_MODE == "record" else None
+_replayer = RpcReplayer(RPC_CAPTURE_FILE, RPC_REPLAY_SPEED) if RPC_MODE == "replay" else None
+_cache = RpcCache(RPC_CACHE_TTL)
+
+
+def _record_request_metrics(endpoint, method, result, sent, received):
+    """
+    Track request latency and errors of your RPC node per method sent.
+    Cached responses and methods answered from DERIVED_METHODS add nothing,
+    since no request of theirs reached the node.
+    """
+    if endpoint != SOLANA_RPC_ENDPOINT:
+        return
+    update_metric(solana_rpc_latency, received - sent, labels={"method": method})
+    update_metric(solana_rpc_requests, 1, labels={"method": method})
+    if "error" in result:
+        update_metric(solana_rpc_errors, 1, labels={"method": method})
+
+
+async def _fetch(session, endpoint, payload):
+    """Send a request over the network (or the replay) and time it"""
+    sent = time.monotonic()
+    if _replayer is not None:
+        result = await _replayer.replay(endpoint, payload)
+    else:
+        async with session.post(endpoint, json=payload, headers=HEADERS) as response:
+            result = await response.json()
+    received = time.monotonic()
+
+    if _recorder is not None:
+        _recorder.record(endpoint, payload, result, sent, received)
+    if not isinstance(payload, list):
+        _record_request_metrics(endpoint, payload.get("method"), result, sent, received)
+    return result, sent, received
+
+
+async def _cached_fetch(session, endpoint, payload):
+    return await _cache.get(request_key(endpoint, payload), lambda: _fetch(session, endpoint, payload))
+
+
+async def rpc_request_timed(session, endpoint, payload, cache=True):
+    """
+    Send a JSON-RPC request (or batch) and return the decoded response
+    along with the monotonic send and receive times of the fetch that
+    produced it.
+
+    Within a collection cycle identical requests are fetched once, and
+    methods listed in DERIVED_METHODS are answered from the richer
+    response they can be derived from. In record mode exchanges are
+    appended to the capture file; in replay mode responses are served from
+    the capture instead of the network.
+
+    Args:
+        session: aiohttp client session
+        endpoint: RPC endpoint URL
+        payload: JSON-RPC request dictionary or list of them
+        cache: Set to False for requests that must always hit the node
+
+    Returns:
+        Tuple of (response, sent, received)
+    """
+    if not cache or isinstance(payload, list):
+        return await _fetch(session, endpoint, payload)
+
+    method = payload.get("method")
+    derived = DERIVED_METHODS.get(method)
+    if derived is None:
+        result, sent, received = await _cached_fetch(session, endpoint, payload)
+    else:
+        source_method, projection = derived
+        source_payload = dict(payload, method=source_method)
+        source_result, sent, received = await _cached_fetch(session, endpoint, source_payload)
+        if "result" in source_result:
+            result = {"jsonrpc": "2.0", "id": payload.get("id"), "result": projection(source_result["result"])}
+        else:
+            result = source_result
+    return result, sent, received
+
+
+async def rpc_request(session, endpoint, payload, cache=True):
+    """
+    Send a JSON-RPC request (or batch) and return the decoded response.
+
+    See rpc_request_timed for caching, record and replay behaviour.
+
+    Args:
+        session: aiohttp client session
+        endpoint: RPC endpoint URL
+        payload: JSON-RPC request dictionary or list of them
+        cache: Set to False for requests that must always hit the node
+    """
+    result, _, _ = await rpc_request_timed(session, endpoint, payload, cache)
+    return result
+
+
+def reset_rpc_cache():
+    """Start a new collection cycle with an empty response cache"""
+    _cache.clear()
+
+
+def scaled_interval(seconds):
+    """Scale a wait between collections to the replay speed"""
+    if _replayer is None:
+        return seconds
+    return seconds / _replayer.speed if _replayer.speed > 0 else 0
+
+
+async def collection_sleep(seconds):
+    """Wait between collections; when replaying the wait is scaled and counted on the capture clock"""
+    if _replayer is not None:
+        _replayer.clock += seconds
+    await asyncio.sleep(scaled_interval(seconds))
+
+
+def collection_clock():
+    """
+    Clock that collector cadences run on: monotonic time when live, capture
+    time when replaying, so slower collectors run in the same cycles as
+    they did in the recording at any replay speed.
+    """
+    return time.monotonic() if _replayer is None else _replayer.clock
+
+
+def replay_finished():
+    """True once a replay has served every recorded response"""
+    return _replayer is not None and _replayer.finished
@@ -0,0 +1,99 @@
+# utils/sampling.py
+import asyncio
+from loguru import logger
+from config import SOLANA_RPC_ENDPOINT, NETWORK_RPC_ENDPOINT
+from utils.rpc import rpc_request_timed
+
+# Nominal slot rate (400 ms slots) used until a rate has been observed
+DEFAULT_SLOT_RATE = 2.5
+
+# Plausible range of observed rates; anything outside is a restart or gap
+MAX_RATE = 10.0
+
+
+class RateEstimator:
+    """Smoothed per-second progress of an increasing value such as a slot"""
+
+    def __init__(self, default_rate=DEFAULT_SLOT_RATE, smoothing=0.3):
+        self.rate = default_rate
+        self.smoothing = smoothing
+        self._last = None
+
+    def update(self, value, timestamp):
+        """
+        Feed a new sample and return the current rate estimate.
+
+        Args:
+            value: Observed value
+            timestamp: Monotonic time the value was observed at
+        """
+        if self._last is not None:
+            last_value, last_timestamp = self._last
+            elapsed = timestamp - last_timestamp
+            if elapsed > 0:
+                rate = (value - last_value) / elapsed
+                if 0 <= rate <= MAX_RATE:
+                    self.rate += self.smoothing * (rate - self.rate)
+        self._last = (value, timestamp)
+        return self.rate
+
+
+class PairedSample:
+    """Local and network responses to the same request, fired together"""
+
+    __slots__ = ("local", "local_time", "network", "network_time")
+
+    def __init__(self, local, local_time, network, network_time):
+        self.local = local
+        self.local_time = local_time
+        self.network = network
+        self.network_time = network_time
+
+    @property
+    def skew(self):
+        """Seconds between the local and the network response midpoints, None if a side failed"""
+        if self.local_time is None or self.network_time is None:
+            return None
+        return self.local_time - self.network_time
+
+    def corrected_diff(self, rate):
+        """
+        Local minus network value, with the network value projected to the
+        time of the local sample using rate.
+
+        Returns:
+            The corrected difference, None if either side has no result
+        """
+        local_value = self.local.get("result")
+        network_value = self.network.get("result")
+        if local_value is None or network_value is None or self.skew is None:
+            return None
+        return local_value - (network_value + self.skew * rate)
+
+
+async def paired_request(session, payload):
+    """
+    Send payload to your RPC and the reference network at the same time.
+
+    Each response is timestamped at the midpoint of its round trip. A side
+    that fails (connection error, undecodable body) is returned as an error
+    response with no timestamp, so the other side can still be published.
+    Raises only if both sides fail.
+    """
+    local, network = await asyncio.gather(
+        rpc_request_timed(session, SOLANA_RPC_ENDPOINT, payload),
+        rpc_request_timed(session, NETWORK_RPC_ENDPOINT, payload),
+        return_exceptions=True
+    )
+    if isinstance(local, Exception) and isinstance(network, Exception):
+        raise local
+
+    sides = []
+    for name, outcome in (("local", local), ("network", network)):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Paired {payload.get('method')} request to the {name} endpoint failed: {outcome}")
+            sides.extend(({"error": {"message": str(outcome)}}, None))
+        else:
+            response, sent, received = outcome
+            sides.extend((response, (sent + received) / 2))
+    return PairedSample(*sides)